@@ -1677,19 +1677,19 @@ def adham_analyze():
         cv_text = _build_cv_text_from_profile(profile.data)
         
         # Run ADHAM analysis
-        analysis = adham_analyzer.analyze(job_posting, cv_text, profile.data)
+        analysis = adham_analyzer.analyze(job_posting, cv_text, profile.data).to_dict()
         
         return jsonify({
             "status": "success",
             "analysis": {
-                "score": analysis.score,
-                "score_breakdown": analysis.score_breakdown,
-                "critical_gaps": analysis.critical_gaps,
-                "high_priority_gaps": analysis.high_priority_gaps,
-                "medium_priority_gaps": analysis.medium_priority_gaps,
-                "low_priority_gaps": analysis.low_priority_gaps,
-                "projected_new_score": analysis.projected_new_score,
-                "recommendations": analysis.recommendations
+                "score": analysis["score"],
+                "score_breakdown": analysis["score_breakdown"],
+                "critical_gaps": analysis["critical_gaps"],
+                "high_priority_gaps": analysis["high_priority_gaps"],
+                "medium_priority_gaps": analysis["medium_priority_gaps"],
+                "low_priority_gaps": analysis["low_priority_gaps"],
+                "projected_new_score": analysis["projected_new_score"],
+                "recommendations": analysis["recommendations"]
             }
         })
     except Exception as e:
@@ -4,27 +4,110 @@ ADHAM - Enhanced ATS Optimization Engine v2.0
 Advanced scoring with analogous experience, keyword criticality, and job-specific requirements
 """
 
+import heapq
 import re
-import json
-from typing import Dict, List, Tuple, Optional
+import sys
+from typing import Dict, List, Tuple, NamedTuple, TextIO
 from dataclasses import dataclass, asdict
 from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
 
+from adham_patterns import AHOCORASICK_AVAILABLE, build_automaton
 
-@dataclass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+class ScoreComponent(NamedTuple):
+    """Score for one framework category plus its scorer details"""
+    score: int
+    max: int
+    details: Dict
+
+    def to_dict(self) -> Dict:
+        return {"score": self.score, "max": self.max, **self.details}
+
+
+class Keyword(NamedTuple):
+    """A weighted job keyword (weight 3=Critical, 2=High, 1=Medium)"""
+    term: str
+    count: int
+    weight: int
+    category: str
+
+
+class Gap(NamedTuple):
+    """A job keyword missing from the CV"""
+    keyword: str
+    frequency: int
+    impact: str
+    strategy: str
+
+
+@dataclass(slots=True, frozen=True)
+class ScoreBreakdown:
+    """Scores for the five framework categories"""
+    hard_req: ScoreComponent
+    keyword_density: ScoreComponent
+    experience: ScoreComponent
+    quantified: ScoreComponent
+    soft_skills: ScoreComponent
+
+    def to_dict(self) -> Dict:
+        """Category-name keyed form used in JSON output"""
+        return {
+            "Hard Requirements": self.hard_req.to_dict(),
+            "Keyword Density": self.keyword_density.to_dict(),
+            "Experience Relevance": self.experience.to_dict(),
+            "Quantified Impact": self.quantified.to_dict(),
+            "Soft Skills & Culture": self.soft_skills.to_dict()
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class ATSAnalysis:
     """Complete ATS analysis result - Enhanced Framework"""
     score: int
-    score_breakdown: Dict
-    critical_gaps: List[str]
-    high_priority_gaps: List[Dict]
-    medium_priority_gaps: List[Dict]
-    low_priority_gaps: List[Dict]
-    analogous_experience: List[Dict]
+    score_breakdown: ScoreBreakdown
+    critical_gaps: Tuple[str, ...]
+    high_priority_gaps: Tuple[Gap, ...]
+    medium_priority_gaps: Tuple[Gap, ...]
+    low_priority_gaps: Tuple[Gap, ...]
+    analogous_experience: Tuple[Dict, ...]
     optimization_strategy: Dict
     optimized_cv: str
     projected_new_score: int
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["score_breakdown"] = self.score_breakdown.to_dict()
+        for field in ("high_priority_gaps", "medium_priority_gaps", "low_priority_gaps"):
+            data[field] = [gap._asdict() for gap in getattr(self, field)]
+        return data
+
+
+@dataclass(slots=True, frozen=True)
+class JobFeatures:
+    """Job-side extraction results, shared by every CV scored against the posting"""
+    job_lower: str
+    job_token_set: frozenset
+    hard_requirements: Dict
+    keywords: List[Keyword]
+    keyword_tiers: Tuple[Tuple[str, ...], ...]  # terms by weight: (critical, high, medium)
+    soft_skills: List[str]
+    seniority: Dict
+    industries: List[str]
 
 
 # Analogous Experience Mappings
@@ -123,6 +206,263 @@ ANALOGOUS_MAPPINGS = {
 }
 
 
+# Precompiled patterns (compiled once at import, reused by every analyze() call)
+_RE_YEARS = re.compile(r"(\d+)\+?\s*(?:years?|yrs?)")
+_RE_WORD = re.compile(r"\b[a-zA-Z]{3,}\b")
+# All quantified-impact patterns fused into one alternation so the CV is scanned once.
+# Longer, more specific forms come first: "6 months reduction" must not stop at "6 m".
+# Every form starts with "$" or a digit; the leading lookahead rejects all other
+# positions before the alternatives are tried (~6x faster on prose-heavy CVs).
+_RE_METRICS = re.compile(r"(?=[$\d])(?:" + "|".join((
+    r'\$[\d,]+(?:\s*(?:million|billion|m))?',
+    r'\d+x\s*(?:growth|increase|improvement)',
+    r'\d+\s*(?:months?|years?)\s*(?:reduction|savings|improvement)',
+    r'\d+\s*(?:team|people|resources|staff)',
+    r'\d+(?:\.\d+)?\s*%',
+    r'\d+\s*(?:million|billion|m)',
+)) + ")")
+
+
+# ASCII text is tokenized with one translate sweep (non-word chars -> space) plus split,
+# which is faster than the regex; non-ASCII text falls back to _RE_WORD.
+_ASCII_NON_WORD = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+
+def _tokenize(text_lower: str) -> List[str]:
+    """Words of 3+ ASCII letters (same tokens as _RE_WORD.findall)"""
+    if text_lower.isascii():
+        return [t for t in text_lower.translate(_ASCII_NON_WORD).split()
+                if len(t) >= 3 and t.isalpha()]
+    return _RE_WORD.findall(text_lower)
+
+
+# Keyword extraction reads at most this much of a posting; only the top 30 terms are kept
+_KEYWORD_TEXT_LIMIT = 32_000
+
+
+# Keyword categories, checked in order; one alternation per category
+_KEYWORD_CATEGORIES = tuple((category, re.compile("|".join(terms))) for category, terms in (
+    ("technical", ("sap", "erp", "api", "cloud", "ai", "ml", "data", "analytics")),
+    ("leadership", ("leadership", "management", "strategy", "stakeholder", "team")),
+    ("domain", ("healthcare", "fintech", "metering", "utilities", "energy")),
+    ("process", ("pmo", "agile", "scrum", "transformation", "implementation")),
+))
+
+# Fixed vocabularies, interned once at import and shared by every analyzer instance
+_STOPWORDS = frozenset(map(sys.intern, (
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "up", "about", "into", "through", "during",
+    "are", "will", "you", "your", "our", "who", "has", "have", "this", "that", "their",
+    "all", "can", "not", "such", "within", "across", "including", "plus", "etc",
+)))
+
+# Extended stopwords for job ads: a hand-picked list of posting vocabulary ("years",
+# "experience", "required", ...) that would otherwise rank as critical keywords
+_POSTING_STOPWORDS = frozenset(map(sys.intern, (
+    "job", "description", "role", "position", "candidate", "ideal", "company",
+    "years", "experience", "required", "preferred", "requirements", "qualifications",
+    "responsibilities", "skills", "knowledge", "ability", "strong", "proven", "excellent",
+    "work", "working",
+)))
+_NON_KEYWORDS = _STOPWORDS | _POSTING_STOPWORDS
+
+_SOFT_SKILLS = tuple(map(sys.intern, (
+    "leadership", "communication", "collaboration", "strategic",
+    "stakeholder", "problem-solving", "analytical", "innovative",
+    "team player", "results-driven", "cross-functional", "agile",
+    "adaptable", "influential", "negotiation", "change management",
+)))
+
+_INDUSTRIES = tuple(map(sys.intern, (
+    "healthcare", "healthtech", "fintech", "technology", "utilities",
+    "energy", "metering", "erp", "sap", "hospital", "medical",
+    "digital transformation", "iot", "smart grid", "ami",
+)))
+
+# Experience fields, checked in order (first match wins)
+_EXPERIENCE_FIELDS = tuple(map(sys.intern, (
+    "healthcare", "healthtech", "fintech", "technology", "erp", "sap",
+    "smart metering", "ami", "utilities", "energy",
+)))
+
+_CERTIFICATIONS = tuple(map(sys.intern, (
+    "pmp", "itil", "csm", "six sigma", "cissp", "mba", "cbap",
+)))
+
+# Education levels (type, trigger terms), checked in order (last match wins)
+_EDUCATION_LEVELS = (
+    ("bachelor", ("bachelor",)),
+    ("master", ("master",)),
+    ("mba", ("mba",)),
+    ("phd", ("phd", "doctorate")),
+)
+
+# Job seniority (level, title, trigger terms), checked in order
+_SENIORITY_LEVELS = (
+    ("executive", "C-suite", ("chief", "cto", "cio", "cfo", "ceo")),
+    ("vp", "VP", ("vp", "vice president", "senior vice president")),
+    ("director", "Director", ("director", "head of")),
+    ("senior", "Senior", ("senior", "sr.")),
+)
+_CV_SENIORITY_TERMS = (
+    "chief", "cto", "cio", "vp", "director", "head", "senior manager", "lead", "principal",
+)
+
+# Every fixed term the extractors test by substring; one scan per text finds them all
+_VOCABULARY = frozenset(
+    _INDUSTRIES + _EXPERIENCE_FIELDS + _CERTIFICATIONS + _CV_SENIORITY_TERMS
+    + tuple(term for _, terms in _EDUCATION_LEVELS for term in terms)
+    + tuple(skill for skill in _SOFT_SKILLS if not skill.isalpha())
+    + tuple(term for _, _, terms in _SENIORITY_LEVELS for term in terms)
+)
+
+if AHOCORASICK_AVAILABLE:
+    _VOCABULARY_AUTOMATON = build_automaton(_VOCABULARY)
+
+
+def _vocabulary_hits(text_lower: str) -> frozenset:
+    """Terms of _VOCABULARY occurring anywhere in text_lower (substring semantics)"""
+    if AHOCORASICK_AVAILABLE:
+        return frozenset(term for _, term in _VOCABULARY_AUTOMATON.iter(text_lower))
+    return frozenset(term for term in _VOCABULARY if term in text_lower)
+
+
+# ANALOGOUS_MAPPINGS lowercased once; entries keep dict order (first match wins)
+_ANALOGOUS_MAPPINGS_LOWER = tuple(
+    (key.lower(), tuple((mapped.lower(), credit) for mapped, credit in mappings))
+    for key, mappings in ANALOGOUS_MAPPINGS.items()
+)
+
+
+@lru_cache(maxsize=4096)
+def _scan_analogy(target_lower: str, source_lower: str) -> float:
+    """Credit of the first mapping whose key and mapped term occur in either term"""
+    for key, mappings in _ANALOGOUS_MAPPINGS_LOWER:
+        if key in target_lower or key in source_lower:
+            for mapped_term, credit in mappings:
+                if mapped_term in source_lower or mapped_term in target_lower:
+                    return credit
+    return 0.0
+
+
+# Analogy credit for every (job industry, CV industry) pair, so scoring is a dict lookup
+_INDUSTRY_ANALOGY = {
+    (target, source): credit
+    for target in _INDUSTRIES
+    for source in _INDUSTRIES
+    if target != source and (credit := _scan_analogy.__wrapped__(target, source))
+}
+
+
+# Keyword gap impact and strategy by weight (3=Critical, 2=High, 1=Medium)
+_GAP_LEVELS = {
+    3: ("10-15 points", "MUST add '{term}' to Summary + 2 bullets"),
+    2: ("5-10 points", "Add to 1-2 relevant bullet points"),
+    1: ("1-5 points", "Add to skills section if relevant"),
+}
+
+
+# ADHAM text report, compiled once at import; rendered from _ReportInputs fields
+_REPORT_HEADER_TEMPLATE = """
+{{sep}}
+                    ADHAM ATS OPTIMIZATION ANALYSIS v2.0
+{{sep}}
+
+JOB: {{job_title}} at {{company}}
+
+{{sep}}
+                    📊 CURRENT ATS SCORE: {{score}}/100
+{{sep}}
+
+Score Breakdown:
+{{rule}}
+Hard Requirements:          {{hard}}/30
+Keyword Density:           {{keyword}}/25
+Experience Relevance:      {{experience}}/20
+Quantified Impact:         {{quantified}}/15
+Soft Skills & Culture:      {{soft}}/10
+{{rule}}
+
+"""
+
+_REPORT_BODY_TEMPLATE = """{% if critical_gaps %}
+🚨 CRITICAL GAPS (Auto-Rejection Risk)
+{{rule}}
+{% for gap in critical_gaps %}
+• {{gap}}
+{% endfor %}
+
+{% endif %}
+{% if high_gaps %}
+⚠️ HIGH PRIORITY GAPS (10-15 point impact)
+{{rule}}
+Critical Keywords (Weight 3):
+| Keyword     | Job Mentions | CV Mentions | Points Lost |
+|-------------|--------------|-------------|-------------|
+{% for keyword, frequency in high_gaps %}
+| {{"%-11s"|format(keyword)}} | {{"%-12s"|format(frequency)}} | 0           | -9          |
+{% endfor %}
+
+{% endif %}
+{% if analogous %}
+🎯 ANALOGOUS EXPERIENCE OPPORTUNITIES
+{{rule}}
+{% for cv_experience, job_requirement, credit in analogous %}
+• CV: {{cv_experience}} ←→ Job: {{job_requirement}} ({{credit}})
+{% endfor %}
+
+{% endif %}
+📈 PROJECTED SCORE: {{projected}}/100
+{{rule}}
+Improvement: +{{projected - score}} points
+
+{% for rec in recommendations %}
+• {{rec}}
+{% endfor %}
+"""
+
+# Compact body when there are no critical, high or medium priority gaps
+_REPORT_NO_GAPS_BODY_TEMPLATE = """✅ NO GAPS FOUND
+{{rule}}
+No critical, high or medium priority gaps: the CV already covers the job's
+hard requirements and priority keywords.
+"""
+
+
+@lru_cache(maxsize=2)
+def _report_template(has_gaps: bool):
+    """Compiled report template, built on first use so scoring never needs jinja2"""
+    from jinja2 import Environment
+    env = Environment(autoescape=False, trim_blocks=True, lstrip_blocks=True)
+    env.globals.update(sep="=" * 80, rule="━" * 79)
+    body = _REPORT_BODY_TEMPLATE if has_gaps else _REPORT_NO_GAPS_BODY_TEMPLATE
+    return env.from_string(_REPORT_HEADER_TEMPLATE + body)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _keyword_density_kernel(counts, weights):
+        """Compiled keyword density: (CVs x keywords) raw counts -> score per CV"""
+        n_cvs, n_keywords = counts.shape
+        points = (0.0, 3.0, 7.0, 15.0)  # indexed by weight
+        totals = np.bincount(weights, minlength=4)
+        
+        scores = np.empty(n_cvs, np.int64)
+        for i in prange(n_cvs):
+            found = np.zeros(4, np.int64)
+            for j in range(n_keywords):
+                # Branchless cap (compiles to a min instruction)
+                found[weights[j]] += min(counts[i, j], 3)
+            total = 0.0
+            for w in range(3, 0, -1):
+                max_found = totals[w] * w if totals[w] else 1
+                total += min(found[w] / max_found * points[w], points[w])
+            scores[i] = int(min(total, 25.0))
+        return scores
+
+
 class ADHAMAnalyzer:
     """
     ADHAM - Advanced ATS Optimization Engine v2.0
@@ -135,78 +475,232 @@ class ADHAMAnalyzer:
     5. Soft Skills & Culture: 10 points
     """
     
-    def __init__(self):
-        self.common_stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during'
-        }
+    # Critical gaps at which mode="screen" rejects without full scoring
+    SCREEN_REJECT_GAPS = 2
     
-    def analyze(self, job_posting: str, cv_text: str, profile: Dict) -> ATSAnalysis:
+    def analyze(self, job_posting: str, cv_text: str, profile: Dict,
+                mode: str = "full") -> ATSAnalysis:
         """
         Complete ATS analysis using enhanced framework
+        
+        mode="screen" checks critical gaps first and, when there are at least
+        SCREEN_REJECT_GAPS of them, returns a screened-out result scored on hard
+        requirements only (no keyword scoring, gaps, strategy or optimized CV).
         """
+        return self._analyze_job_features(
+            self._extract_job_features(job_posting), cv_text, profile, mode
+        )
+    
+    def analyze_many(self, items: List[Tuple[str, str, Dict]]) -> List[ATSAnalysis]:
+        """
+        Batch analysis over (job_posting, cv_text, profile) triples.
+        Each distinct job posting is extracted once and reused for every CV scored against it.
+        """
+        features: Dict[str, JobFeatures] = {}
+        results = []
+        for job_posting, cv_text, profile in items:
+            job = features.get(job_posting)
+            if job is None:
+                job = features[job_posting] = self._extract_job_features(job_posting)
+            results.append(self._analyze_job_features(job, cv_text, profile))
+        return results
+    
+    def score_batch(self, job_posting: str, cvs: List[str],
+                    profiles: List[Dict]) -> List[int]:
+        """
+        Bulk screening: total ATS score for each (cv_text, profile) pair against one
+        job posting, without gap analysis or CV generation. Keyword density is scored
+        over a CV x keyword matrix with NumPy when it is installed.
+        """
+        return self.score_matrix([job_posting], cvs, profiles)[0]
+    
+    def score_matrix(self, job_postings: List[str], cvs: List[str],
+                     profiles: List[Dict]) -> List[List[int]]:
+        """
+        Cross-product screening: scores[j][i] is the total ATS score of
+        (cvs[i], profiles[i]) against job_postings[j]. Everything that depends on
+        the CV alone (tokens, vocabulary hits, quantified impact) is computed once
+        per CV, not once per pair.
+        """
+        cvs_lower = [cv.lower() for cv in cvs]
+        cvs_tokens = [Counter(_tokenize(cv_lower)) for cv_lower in cvs_lower]
+        cvs_hits = [_vocabulary_hits(cv_lower) for cv_lower in cvs_lower]
+        cvs_education = [self._cv_education(profile) for profile in profiles]
+        cvs_cert_prefixes = [self._cert_prefixes(profile) for profile in profiles]
+        quantified_scores = [
+            self._score_quantified_achievements(cv_lower)[0] for cv_lower in cvs_lower
+        ]
+        
+        matrix = []
+        for job_posting in job_postings:
+            job = self._extract_job_features(job_posting)
+            if NUMPY_AVAILABLE:
+                keyword_scores = self._score_keyword_density_batch(job.keywords, cvs_tokens)
+            else:
+                keyword_scores = [
+                    self._score_keyword_density(job.keyword_tiers, cv_tokens)[0]
+                    for cv_tokens in cvs_tokens
+                ]
+            
+            scores = []
+            for i, profile in enumerate(profiles):
+                hard_score, _ = self._score_hard_requirements(
+                    job.hard_requirements, cvs_education[i], profile, cvs_cert_prefixes[i]
+                )
+                exp_score, _, _ = self._score_experience_relevance(
+                    job.industries, cvs_hits[i], job.seniority
+                )
+                soft_score, _ = self._score_soft_skills(
+                    job.soft_skills, cvs_hits[i], cvs_tokens[i]
+                )
+                scores.append(hard_score + keyword_scores[i] + exp_score
+                              + quantified_scores[i] + soft_score)
+            matrix.append(scores)
+        return matrix
+    
+    @staticmethod
+    def _cert_prefixes(profile: Dict) -> frozenset:
+        """
+        Every substring of each CV cert's lowercased 4-char prefix, shared by the
+        scoring and gap phases so "req[:4] in prefix" becomes one set lookup
+        """
+        return frozenset(
+            prefix[i:j]
+            for prefix in (c.lower()[:4] for c in profile.get("certifications", []))
+            for i in range(len(prefix))
+            for j in range(i + 1, len(prefix) + 1)
+        )
+    
+    @staticmethod
+    def _cv_education(profile: Dict) -> str:
+        """Profile degrees lowercased and joined once, shared by scoring and gap phases"""
+        return " ".join(e.get("degree", "").lower() for e in profile.get("education", []))
+    
+    def _extract_job_features(self, job_posting: str) -> JobFeatures:
+        """Step 1: extract job requirements (lowercased and tokenized once)"""
         job_lower = job_posting.lower()
-        cv_lower = cv_text.lower()
+        job_tokens = _tokenize(job_lower)
+        job_token_set = frozenset(job_tokens)
+        job_hits = _vocabulary_hits(job_lower)
+        if len(job_lower) > _KEYWORD_TEXT_LIMIT:
+            keyword_text = job_lower[:_KEYWORD_TEXT_LIMIT]
+            keywords = self._extract_weighted_keywords(keyword_text, _tokenize(keyword_text))
+        else:
+            keywords = self._extract_weighted_keywords(job_lower, job_tokens)
+        
+        return JobFeatures(
+            job_lower=job_lower,
+            job_token_set=job_token_set,
+            hard_requirements=self._extract_hard_requirements(job_lower, job_hits),
+            keywords=keywords,
+            keyword_tiers=tuple(
+                tuple(kw.term for kw in keywords if kw.weight == weight)
+                for weight in (3, 2, 1)
+            ),
+            soft_skills=self._extract_soft_skills(job_hits, job_token_set),
+            seniority=self._extract_seniority(job_hits),
+            industries=self._extract_industries(job_hits)
+        )
+    
+    def _analyze_job_features(self, job: JobFeatures, cv_text: str,
+                              profile: Dict, mode: str = "full") -> ATSAnalysis:
+        """Score one CV against already-extracted job features"""
+        hard_requirements = job.hard_requirements
+        keywords = job.keywords
         
-        # Step 1: Extract job requirements
-        hard_requirements = self._extract_hard_requirements(job_posting)
-        keywords = self._extract_weighted_keywords(job_posting)
-        soft_skills = self._extract_soft_skills(job_posting)
-        seniority = self._extract_seniority(job_posting)
+        cv_lower = cv_text.lower()
+        # Degrees are only compared when the posting names an education level
+        cv_education = (self._cv_education(profile)
+                        if hard_requirements["education"]["type"] else "")
+        cv_cert_prefixes = self._cert_prefixes(profile)
         
-        # Step 2: Score each component
+        critical = self._identify_critical_gaps(
+            hard_requirements, cv_education, profile, cv_cert_prefixes
+        )
         hard_score, hard_details = self._score_hard_requirements(
-            hard_requirements, cv_lower, profile
+            hard_requirements, cv_education, profile, cv_cert_prefixes
         )
+        if mode == "screen" and len(critical) >= self.SCREEN_REJECT_GAPS:
+            return self._screened_out(hard_score, hard_details, critical)
+        
+        # Step 2: Score each component
+        # Token counts double as the CV's word set for membership checks
+        cv_tokens = Counter(_tokenize(cv_lower))
+        cv_hits = _vocabulary_hits(cv_lower)
         keyword_score, keyword_details = self._score_keyword_density(
-            keywords, cv_lower
+            job.keyword_tiers, cv_tokens
         )
         exp_score, exp_details, analogous = self._score_experience_relevance(
-            job_posting, cv_lower, seniority
+            job.industries, cv_hits, job.seniority
         )
-        quantified_score, quantified_details = self._score_quantified_achievements(cv_text)
-        soft_score, soft_details = self._score_soft_skills(soft_skills, cv_lower)
+        quantified_score, quantified_details = self._score_quantified_achievements(cv_lower)
+        soft_score, soft_details = self._score_soft_skills(job.soft_skills, cv_hits, cv_tokens)
         
         # Calculate total
         total_score = hard_score + keyword_score + exp_score + quantified_score + soft_score
         
         # Identify gaps
-        critical = self._identify_critical_gaps(hard_requirements, cv_lower, profile)
-        high_priority = self._identify_high_priority_gaps(keywords, cv_lower)
-        medium_priority = self._identify_medium_priority_gaps(keywords, cv_lower)
-        low_priority = self._identify_low_priority_gaps(keywords, cv_lower)
+        high_priority, medium_priority, low_priority = self._classify_gaps(
+            keywords, cv_tokens
+        )
         
         # Generate optimization
         strategy = self._generate_optimization_strategy(
             keywords, critical, high_priority, medium_priority, analogous, profile
         )
-        optimized_cv = self._generate_optimized_cv(profile, strategy, job_posting)
+        optimized_cv = self._generate_optimized_cv(profile, strategy)
         projected = self._calculate_projected_score(total_score, critical, high_priority, medium_priority)
         recommendations = self._generate_recommendations(critical, high_priority, medium_priority, projected)
         
         return ATSAnalysis(
             score=total_score,
-            score_breakdown={
-                "Hard Requirements": {"score": hard_score, "max": 30, **hard_details},
-                "Keyword Density": {"score": keyword_score, "max": 25, **keyword_details},
-                "Experience Relevance": {"score": exp_score, "max": 20, **exp_details},
-                "Quantified Impact": {"score": quantified_score, "max": 15, **quantified_details},
-                "Soft Skills & Culture": {"score": soft_score, "max": 10, **soft_details}
-            },
-            critical_gaps=critical,
-            high_priority_gaps=high_priority,
-            medium_priority_gaps=medium_priority,
-            low_priority_gaps=low_priority,
-            analogous_experience=analogous,
+            score_breakdown=ScoreBreakdown(
+                hard_req=ScoreComponent(hard_score, 30, hard_details),
+                keyword_density=ScoreComponent(keyword_score, 25, keyword_details),
+                experience=ScoreComponent(exp_score, 20, exp_details),
+                quantified=ScoreComponent(quantified_score, 15, quantified_details),
+                soft_skills=ScoreComponent(soft_score, 10, soft_details)
+            ),
+            critical_gaps=tuple(critical),
+            high_priority_gaps=tuple(high_priority),
+            medium_priority_gaps=tuple(medium_priority),
+            low_priority_gaps=tuple(low_priority),
+            analogous_experience=tuple(analogous),
             optimization_strategy=strategy,
             optimized_cv=optimized_cv,
             projected_new_score=projected,
-            recommendations=recommendations
+            recommendations=tuple(recommendations)
+        )
+    
+    def _screened_out(self, hard_score: int, hard_details: Dict,
+                      critical: List[str]) -> ATSAnalysis:
+        """Result for a CV rejected in screen mode: only hard requirements are scored"""
+        skipped = {"screened_out": True}
+        return ATSAnalysis(
+            score=hard_score,
+            score_breakdown=ScoreBreakdown(
+                hard_req=ScoreComponent(hard_score, 30, hard_details),
+                keyword_density=ScoreComponent(0, 25, skipped),
+                experience=ScoreComponent(0, 20, skipped),
+                quantified=ScoreComponent(0, 15, skipped),
+                soft_skills=ScoreComponent(0, 10, skipped)
+            ),
+            critical_gaps=tuple(critical),
+            high_priority_gaps=(),
+            medium_priority_gaps=(),
+            low_priority_gaps=(),
+            analogous_experience=(),
+            optimization_strategy={},
+            optimized_cv="",
+            projected_new_score=hard_score,
+            recommendations=(
+                f"SCREENED OUT: {len(critical)} auto-rejection gaps, full analysis skipped",
+            )
         )
     
     # ==================== HARD REQUIREMENTS (30 points) ====================
     
-    def _extract_hard_requirements(self, text: str) -> Dict:
+    def _extract_hard_requirements(self, job_lower: str, job_hits: frozenset) -> Dict:
         """Extract must-have requirements from job posting"""
         requirements = {
             "education": {"required": None, "type": None},
@@ -216,38 +710,28 @@ class ADHAMAnalyzer:
         }
         
         # Education extraction
-        if re.search(r"bachelor['s]?\s*(?:degree|dgree)?", text.lower()):
-            requirements["education"]["type"] = "bachelor"
-        if re.search(r"master['s]?\s*(?:degree|mba)?", text.lower()):
-            requirements["education"]["type"] = "master"
-        if re.search(r"mba", text.lower()):
-            requirements["education"]["type"] = "mba"
-        if re.search(r"phd|doctorate", text.lower()):
-            requirements["education"]["type"] = "phd"
+        for edu_type, terms in _EDUCATION_LEVELS:
+            if any(term in job_hits for term in terms):
+                requirements["education"]["type"] = edu_type
         
         # Years of experience
-        years_match = re.search(r"(\d+)\+?\s*(?:years?|yrs?)", text.lower())
-        if years_match:
+        if (years_match := _RE_YEARS.search(job_lower)):
             requirements["experience"]["years"] = int(years_match.group(1))
         
         # Experience field
-        fields = ["healthcare", "healthtech", "fintech", "technology", "erp", "sap", 
-                  "smart metering", "ami", "utilities", "energy"]
-        for field in fields:
-            if field in text.lower():
+        for field in _EXPERIENCE_FIELDS:
+            if field in job_hits:
                 requirements["experience"]["field"] = field
                 break
         
         # Certifications
-        certs = ["pmp", "itil", "csm", "six sigma", "cissp", "cissp", "mba", "cbap"]
-        for cert in certs:
-            if cert in text.lower():
-                requirements["certifications"].append(cert)
+        requirements["certifications"] = [c for c in _CERTIFICATIONS if c in job_hits]
         
         return requirements
     
-    def _score_hard_requirements(self, requirements: Dict, cv_lower: str, 
-                                  profile: Dict) -> Tuple[int, Dict]:
+    def _score_hard_requirements(self, requirements: Dict, cv_education: str, 
+                                  profile: Dict,
+                                  cv_cert_prefixes: frozenset) -> Tuple[int, Dict]:
         """Score hard requirements (max 30 points)"""
         score = 0
         details = {"education": {}, "experience": {}, "certifications": {}}
@@ -255,11 +739,6 @@ class ADHAMAnalyzer:
         # Education (max 10 points)
         edu_type = requirements.get("education", {}).get("type")
         if edu_type:
-            cv_education = " ".join([
-                e.get("degree", "").lower() 
-                for e in profile.get("education", [])
-            ])
-            
             if edu_type == "bachelor":
                 if "bachelor" in cv_education or "bsc" in cv_education:
                     score += 10
@@ -315,10 +794,9 @@ class ADHAMAnalyzer:
         
         # Certifications (max 10 points)
         req_certs = requirements.get("certifications", [])
-        cv_certs = [c.lower() for c in profile.get("certifications", [])]
         
         if req_certs:
-            matches = sum(1 for c in req_certs if any(c[:4] in cert[:4] for cert in cv_certs))
+            matches = sum(1 for c in req_certs if c[:4] in cv_cert_prefixes)
             match_rate = matches / len(req_certs)
             
             if match_rate >= 1.0:
@@ -341,30 +819,37 @@ class ADHAMAnalyzer:
     
     # ==================== KEYWORD DENSITY (25 points) ====================
     
-    def _extract_weighted_keywords(self, text: str) -> List[Dict]:
+    def _extract_weighted_keywords(self, job_lower: str, job_tokens: List[str]) -> List[Keyword]:
         """Extract keywords with context weights"""
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        filtered = [w for w in words if w not in self.common_stopwords]
-        counts = Counter(filtered)
+        counts = Counter(w for w in job_tokens if w not in _NON_KEYWORDS)
+        
+        # A keyword is "required" when a trigger phrase ends within 100 chars after its
+        # first occurrence, i.e. when pos + 100 reaches the earliest trigger end
+        trigger_end = min(
+            (i + len(x) for x in ("required", "must have", "essential")
+             if (i := job_lower.find(x)) >= 0),
+            default=None
+        )
+        # Short lines among the first 5 are likely the title
+        title_text = "\n".join(line for line in job_lower.split("\n", 5)[:5] if len(line) < 100)
         
-        text_lower = text.lower()
         keywords = []
+        # Bound methods hoisted out of the per-keyword loop
+        find = job_lower.find
+        categorize = self._categorize_keyword
+        append = keywords.append
         
         for word, count in counts.most_common(50):
             # Weight 3: CRITICAL (in title, "required", technical specs)
             weight = 1
             
-            if (word in text_lower and 
-                any(x in text_lower[:text_lower.find(word)+100] 
-                    for x in ["required", "must have", "essential"])):
+            if (trigger_end is not None and
+                    (pos := find(word)) >= 0 and pos + 100 >= trigger_end):
                 weight = 3
             
             # Title proximity bonus
-            lines = text_lower.split('\n')
-            for line in lines[:5]:
-                if word in line and len(line) < 100:  # Likely title
-                    weight = 3
-                    break
+            if word in title_text:
+                weight = 3
             
             # High frequency bonus
             if count >= 5:
@@ -372,52 +857,29 @@ class ADHAMAnalyzer:
             elif count >= 3:
                 weight = max(weight, 1)
             
-            keywords.append({
-                "term": word,
-                "count": count,
-                "weight": weight,  # 3=Critical, 2=High, 1=Medium
-                "category": self._categorize_keyword(word)
-            })
-        
-        # Sort by weight then count
-        keywords.sort(key=lambda x: (x["weight"], x["count"]), reverse=True)
-        
-        return keywords[:30]
-    
-    def _categorize_keyword(self, word: str) -> str:
-        """Categorize keyword type"""
-        categories = {
-            "technical": ["sap", "erp", "api", "cloud", "ai", "ml", "data", "analytics"],
-            "leadership": ["leadership", "management", "strategy", "stakeholder", "team"],
-            "domain": ["healthcare", "fintech", "metering", "utilities", "energy"],
-            "process": ["pmo", "agile", "scrum", "transformation", "implementation"]
-        }
+            append(Keyword(word, count, weight, categorize(word)))
         
-        for cat, terms in categories.items():
-            if any(t in word for t in terms):
+        # Top 30 by weight then count
+        return heapq.nlargest(30, keywords, key=attrgetter("weight", "count"))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_keyword(word: str) -> str:
+        """Categorize keyword type (memoized: the same terms recur across postings)"""
+        for cat, pattern in _KEYWORD_CATEGORIES:
+            if pattern.search(word):
                 return cat
         return "general"
     
-    def _score_keyword_density(self, keywords: List[Dict], cv_lower: str) -> Tuple[int, Dict]:
+    def _score_keyword_density(self, keyword_tiers: Tuple[Tuple[str, ...], ...],
+                               cv_tokens: Counter) -> Tuple[int, Dict]:
         """Score keyword matching with weights (max 25 points)"""
-        critical_found = 0
-        high_found = 0
-        medium_found = 0
-        critical_total = len([k for k in keywords if k["weight"] == 3])
-        high_total = len([k for k in keywords if k["weight"] == 2])
-        medium_total = len([k for k in keywords if k["weight"] == 1])
-        
-        for kw in keywords:
-            if kw["term"] in cv_lower:
-                cv_count = cv_lower.count(kw["term"])
-                capped_count = min(cv_count, 3)
-                
-                if kw["weight"] == 3:
-                    critical_found += capped_count
-                elif kw["weight"] == 2:
-                    high_found += capped_count
-                else:
-                    medium_found += capped_count
+        # Job terms come pre-grouped by weight, so each tier is a flat sum of capped counts
+        critical_terms, high_terms, medium_terms = keyword_tiers
+        critical_found = sum(min(cv_tokens[t], 3) for t in critical_terms)
+        high_found = sum(min(cv_tokens[t], 3) for t in high_terms)
+        medium_found = sum(min(cv_tokens[t], 3) for t in medium_terms)
+        critical_total, high_total, medium_total = map(len, keyword_tiers)
         
         # Calculate score
         max_critical = critical_total * 3 if critical_total else 1
@@ -436,38 +898,54 @@ class ADHAMAnalyzer:
             "medium": {"found": medium_found, "total": medium_total}
         }
     
+    def _score_keyword_density_batch(self, keywords: List[Keyword],
+                                     cvs_tokens: List[Counter]) -> List[int]:
+        """Keyword density for many CVs at once (NumPy path of _score_keyword_density)"""
+        terms = [kw.term for kw in keywords]
+        weights = np.array([kw.weight for kw in keywords], dtype=np.intp)
+        
+        # counts[i, j]: occurrences of keyword j in CV i, 0 when absent
+        counts = np.array(
+            [[cv_tokens[term] for term in terms] for cv_tokens in cvs_tokens],
+            dtype=np.int32
+        ).reshape(len(cvs_tokens), len(terms))
+        
+        if NUMBA_AVAILABLE:
+            return _keyword_density_kernel(counts, weights).tolist()
+        
+        # Capped counts summed per weight in one product: found[i, w] over weights 0..3
+        found = np.minimum(counts, 3) @ (weights[:, None] == np.arange(4)).astype(np.int32)
+        totals = np.bincount(weights, minlength=4)
+        
+        total = np.zeros(len(cvs_tokens))
+        for weight, points in ((3, 15), (2, 7), (1, 3)):
+            max_found = totals[weight] * weight if totals[weight] else 1
+            total += np.minimum(found[:, weight] / max_found * points, points)
+        
+        return np.minimum(total, 25).astype(int).tolist()
+    
     # ==================== EXPERIENCE RELEVANCE (20 points) ====================
     
-    def _extract_seniority(self, text: str) -> Dict:
+    def _extract_seniority(self, job_hits: frozenset) -> Dict:
         """Extract seniority requirements"""
         seniority = {"level": "mid", "title": None, "scope": {}}
         
-        text_lower = text.lower()
-        
-        if any(x in text_lower for x in ["chief", "cto", "cio", "cfo", "ceo"]):
-            seniority["level"] = "executive"
-            seniority["title"] = "C-suite"
-        elif any(x in text_lower for x in ["vp", "vice president", "senior vice president"]):
-            seniority["level"] = "vp"
-            seniority["title"] = "VP"
-        elif any(x in text_lower for x in ["director", "head of"]):
-            seniority["level"] = "director"
-            seniority["title"] = "Director"
-        elif any(x in text_lower for x in ["senior", "sr."]):
-            seniority["level"] = "senior"
-            seniority["title"] = "Senior"
+        for level, title, terms in _SENIORITY_LEVELS:
+            if any(x in job_hits for x in terms):
+                seniority["level"] = level
+                seniority["title"] = title
+                break
         
         return seniority
     
-    def _score_experience_relevance(self, job_posting: str, cv_lower: str,
+    def _score_experience_relevance(self, job_industries: List[str], cv_hits: frozenset,
                                     seniority: Dict) -> Tuple[int, Dict, List]:
         """Score experience with analogous mapping (max 20 points)"""
         score = 0
         analogous = []
         
         # Industry match
-        job_industries = self._extract_industries(job_posting)
-        cv_industries = self._extract_industries(cv_lower)
+        cv_industries = self._extract_industries(cv_hits)
         
         industry_score = 0
         for job_ind in job_industries:
@@ -488,7 +966,7 @@ class ADHAMAnalyzer:
                         break
         
         # Seniority alignment
-        seniority_score = self._score_seniority(seniority, cv_lower)
+        seniority_score = self._score_seniority(seniority, cv_hits)
         
         total = min(industry_score + seniority_score, 20)
         
@@ -498,42 +976,27 @@ class ADHAMAnalyzer:
             "industries_found": cv_industries
         }, analogous
     
-    def _extract_industries(self, text: str) -> List[str]:
-        """Extract industry keywords"""
-        industries = []
-        keywords = [
-            "healthcare", "healthtech", "fintech", "technology", "utilities", 
-            "energy", "metering", "erp", "sap", "hospital", "medical",
-            "digital transformation", "iot", "smart grid", "ami"
-        ]
-        
-        for kw in keywords:
-            if kw in text.lower():
-                industries.append(kw)
-        
-        return industries
+    def _extract_industries(self, hits: frozenset) -> List[str]:
+        """Extract industry keywords from a text's vocabulary hits"""
+        return [kw for kw in _INDUSTRIES if kw in hits]
     
-    def _get_analogy_score(self, target: str, source: str) -> float:
-        """Get analogous experience credit score"""
-        target_lower = target.lower()
-        source_lower = source.lower()
-        
+    def _get_analogy_score(self, target_lower: str, source_lower: str) -> float:
+        """Get analogous experience credit score (both terms already lowercased)"""
         # Direct mapping
         if target_lower == source_lower:
             return 1.0
         
-        # Check predefined mappings
-        for key, mappings in ANALOGOUS_MAPPINGS.items():
-            if key in target_lower or key in source_lower:
-                for mapped_term, credit in mappings:
-                    if mapped_term in source_lower or mapped_term in target_lower:
-                        return credit
-        
-        return 0.0
+        # Industry pairs are precomputed; other terms fall back to the mapping scan
+        credit = _INDUSTRY_ANALOGY.get((target_lower, source_lower))
+        if credit is not None:
+            return credit
+        if target_lower in _INDUSTRIES and source_lower in _INDUSTRIES:
+            return 0.0
+        return _scan_analogy(target_lower, source_lower)
     
-    def _score_seniority(self, seniority: Dict, cv_lower: str) -> int:
+    def _score_seniority(self, seniority: Dict, cv_hits: frozenset) -> int:
         """Score seniority alignment"""
-        cv_titles = cv_lower
+        cv_titles = cv_hits
         
         if seniority["level"] == "executive":
             if any(x in cv_titles for x in ["chief", "cto", "cio", "vp", "director", "head"]):
@@ -560,21 +1023,9 @@ class ADHAMAnalyzer:
     
     # ==================== QUANTIFIED IMPACT (15 points) ====================
     
-    def _score_quantified_achievements(self, cv_text: str) -> Tuple[int, Dict]:
+    def _score_quantified_achievements(self, cv_lower: str) -> Tuple[int, Dict]:
         """Score quantified achievements (max 15 points)"""
-        patterns = [
-            r'\$[\d,]+(?:\s*(?:million|billion|m))?',
-            r'\d+(?:\.\d+)?\s*%',
-            r'\d+\s*(?:million|billion|m)',
-            r'\d+\s*(?:team|people|resources|staff)',
-            r'\d+x\s*(?:growth|increase|improvement)',
-            r'\d+\s*(?:months?|years?)\s*(?:reduction|savings|improvement)',
-        ]
-        
-        metrics = []
-        for pattern in patterns:
-            matches = re.findall(pattern, cv_text.lower())
-            metrics.extend(matches)
+        metrics = _RE_METRICS.findall(cv_lower)
         
         score = min(len(metrics) * 3, 15)
         
@@ -582,45 +1033,41 @@ class ADHAMAnalyzer:
     
     # ==================== SOFT SKILLS (10 points) ====================
     
-    def _extract_soft_skills(self, text: str) -> List[str]:
+    def _extract_soft_skills(self, job_hits: frozenset, job_token_set: set) -> List[str]:
         """Extract soft skills from job posting"""
-        skills = []
-        keywords = [
-            "leadership", "communication", "collaboration", "strategic", 
-            "stakeholder", "problem-solving", "analytical", "innovative",
-            "team player", "results-driven", "cross-functional", "agile",
-            "adaptable", "influential", "negotiation", "change management"
-        ]
-        
-        text_lower = text.lower()
-        for skill in keywords:
-            if skill in text_lower:
-                skills.append(skill)
-        
-        return skills
+        # Single-word skills match whole tokens; phrases come from the vocabulary scan
+        return [skill for skill in _SOFT_SKILLS
+                if (skill in job_token_set if skill.isalpha() else skill in job_hits)]
     
-    def _score_soft_skills(self, required_skills: List[str], cv_lower: str) -> Tuple[int, Dict]:
+    def _score_soft_skills(self, required_skills: List[str], cv_hits: frozenset,
+                           cv_tokens: Counter) -> Tuple[int, Dict]:
         """Score soft skills match (max 10 points)"""
-        matched = [s for s in required_skills if s in cv_lower]
+        matched, missing = [], []
+        for skill in required_skills:
+            # Multi-word skills ("team player", "cross-functional") are substring matches
+            found = skill in cv_tokens if skill.isalpha() else skill in cv_hits
+            (matched if found else missing).append(skill)
         score = min(len(matched) * 2, 10)
         
-        return score, {"matched": matched, "missing": [s for s in required_skills if s not in cv_lower]}
+        return score, {"matched": matched, "missing": missing}
     
     # ==================== GAP IDENTIFICATION ====================
     
-    def _identify_critical_gaps(self, requirements: Dict, cv_lower: str, 
-                                profile: Dict) -> List[str]:
+    def _identify_critical_gaps(self, requirements: Dict, cv_education: str, 
+                                profile: Dict,
+                                cv_cert_prefixes: frozenset) -> List[str]:
         """Identify gaps that may cause auto-rejection"""
         gaps = []
         
         # Check education
         edu_type = requirements.get("education", {}).get("type")
         if edu_type:
-            cv_edu = " ".join([e.get("degree", "").lower() for e in profile.get("education", [])])
-            if "bachelor" in edu_type and not any(x in cv_edu for x in ["bachelor", "bsc", "b.com"]):
-                gaps.append(f"Missing: Bachelor's degree (Required)")
-            if "mba" in edu_type and "mba" not in cv_edu and "master" not in cv_edu:
-                gaps.append(f"Missing: MBA (Preferred/Required)")
+            if edu_type == "bachelor":
+                if not any(x in cv_education for x in ("bachelor", "bsc", "b.com")):
+                    gaps.append(f"Missing: Bachelor's degree (Required)")
+            elif edu_type == "mba":
+                if "mba" not in cv_education and "master" not in cv_education:
+                    gaps.append(f"Missing: MBA (Preferred/Required)")
         
         # Check experience
         req_years = requirements.get("experience", {}).get("years")
@@ -629,94 +1076,72 @@ class ADHAMAnalyzer:
             gaps.append(f"Experience gap: {req_years}+ years required, have {total_exp}")
         
         # Check certifications
-        req_certs = requirements.get("certifications", [])
-        cv_certs = [c.lower() for c in profile.get("certifications", [])]
-        for cert in req_certs:
-            if not any(cert[:4] in c[:4] for c in cv_certs):
+        for cert in requirements.get("certifications", []):
+            if cert[:4] not in cv_cert_prefixes:
                 gaps.append(f"Missing certification: {cert.upper()}")
         
         return gaps
     
-    def _identify_high_priority_gaps(self, keywords: List[Dict], cv_lower: str) -> List[Dict]:
-        """Identify critical keywords (weight 3) missing from CV"""
-        gaps = []
-        for kw in keywords:
-            if kw["weight"] == 3 and kw["term"] not in cv_lower:
-                gaps.append({
-                    "keyword": kw["term"],
-                    "frequency": kw["count"],
-                    "impact": "10-15 points",
-                    "strategy": f"MUST add '{kw['term']}' to Summary + 2 bullets"
-                })
-        return gaps[:5]
-    
-    def _identify_medium_priority_gaps(self, keywords: List[Dict], cv_lower: str) -> List[Dict]:
-        """Identify high-frequency keywords (weight 2) missing"""
-        gaps = []
-        for kw in keywords:
-            if kw["weight"] == 2 and kw["term"] not in cv_lower:
-                gaps.append({
-                    "keyword": kw["term"],
-                    "frequency": kw["count"],
-                    "impact": "5-10 points",
-                    "strategy": f"Add to 1-2 relevant bullet points"
-                })
-        return gaps[:5]
-    
-    def _identify_low_priority_gaps(self, keywords: List[Dict], cv_lower: str) -> List[Dict]:
-        """Identify medium-frequency keywords"""
-        gaps = []
+    def _classify_gaps(self, keywords: List[Keyword],
+                       cv_tokens: Counter) -> Tuple[List[Gap], List[Gap], List[Gap]]:
+        """
+        Identify keywords missing from the CV in a single pass, bucketed by weight:
+        high (weight 3, critical), medium (weight 2, high-frequency), low (weight 1).
+        Each bucket holds at most 5 gaps.
+        """
+        buckets = {3: [], 2: [], 1: []}
         for kw in keywords:
-            if kw["weight"] == 1 and kw["term"] not in cv_lower:
-                gaps.append({
-                    "keyword": kw["term"],
-                    "frequency": kw["count"],
-                    "impact": "1-5 points",
-                    "strategy": f"Add to skills section if relevant"
-                })
-        return gaps[:5]
+            bucket = buckets[kw.weight]
+            if len(bucket) == 5 or kw.term in cv_tokens:
+                continue
+            impact, strategy = _GAP_LEVELS[kw.weight]
+            # Interned so identical strategies across gaps and analyses share one object
+            bucket.append(Gap(kw.term, kw.count, impact,
+                              sys.intern(strategy.format(term=kw.term))))
+        return buckets[3], buckets[2], buckets[1]
     
     # ==================== OPTIMIZATION ====================
     
-    def _generate_optimization_strategy(self, keywords: List[Dict], 
+    def _generate_optimization_strategy(self, keywords: List[Keyword], 
                                        critical: List[str],
-                                       high: List[Dict], 
-                                       medium: List[Dict],
+                                       high: List[Gap], 
+                                       medium: List[Gap],
                                        analogous: List[Dict],
                                        profile: Dict) -> Dict:
         """Generate section-by-section optimization strategy"""
+        high_terms = [h.keyword for h in high]
         
         strategy = {
             "professional_summary": {
-                "current_issues": [c for c in critical if "degree" in c.lower()],
-                "keywords_to_add": [kw["term"] for kw in keywords[:5]],
+                # Gap messages are generated in lowercase-"degree" form, no .lower() needed
+                "current_issues": [c for c in critical if "degree" in c],
+                "keywords_to_add": [kw.term for kw in keywords[:5]],
                 "positioning": "Lead with job title + critical keywords"
             },
             "experience_bullets": {
-                "high_priority": [h["keyword"] for h in high[:3]],
+                "high_priority": high_terms[:3],
                 "analogous_to_highlight": analogous[:3],
                 "format": "Action verb + metric + keyword"
             },
             "skills_section": {
-                "missing_critical": [h["keyword"] for h in high],
-                "suggested_additions": [m["keyword"] for m in medium[:5]]
+                "missing_critical": high_terms,
+                "suggested_additions": [m.keyword for m in medium[:5]]
             }
         }
         
         return strategy
     
-    def _generate_optimized_cv(self, profile: Dict, strategy: Dict,
-                              job_posting: str) -> str:
+    def _generate_optimized_cv(self, profile: Dict, strategy: Dict) -> str:
         """Generate optimized CV text"""
         
-        optimized = f"""
+        parts = [f"""
 {'='*80}
 OPTIMIZED CV FOR ATS - {profile.get('name', 'Candidate')}
 {'='*80}
 
 PROFESSIONAL SUMMARY
 --------------------------------------------------------------------------------
-"""
+"""]
         
         # Optimized summary with keywords
         summary_kw = strategy.get("professional_summary", {}).get("keywords_to_add", [])[:5]
@@ -724,35 +1149,33 @@ PROFESSIONAL SUMMARY
         
         if summary_kw:
             kw_phrase = ", ".join(summary_kw[:3])
-            optimized += f"{current_summary}\n\nExpertise in: {kw_phrase}\n"
+            parts.append(f"{current_summary}\n\nExpertise in: {kw_phrase}\n")
         
-        optimized += """
+        parts.append("""
 CORE COMPETENCIES
 --------------------------------------------------------------------------------
-"""
+""")
         # Add missing keywords to skills
         skills = strategy.get("skills_section", {}).get("suggested_additions", [])
-        for skill in skills[:10]:
-            optimized += f"• {skill.title()}\n"
+        parts.extend(f"• {skill.title()}\n" for skill in skills[:10])
         
-        optimized += """
+        parts.append("""
 PROFESSIONAL EXPERIENCE
 --------------------------------------------------------------------------------
-"""
+""")
         for exp in profile.get("experience", []):
-            optimized += f"""
+            parts.append(f"""
 {exp.get('title', '')} | {exp.get('company', '')}
 {exp.get('period', '')} | {exp.get('location', '')}
 
-"""
+""")
             # Add keywords to achievements
-            for ach in exp.get('achievements', []):
-                optimized += f"• {ach}\n"
+            parts.extend(f"• {ach}\n" for ach in exp.get('achievements', []))
         
-        return optimized
+        return "".join(parts)
     
     def _calculate_projected_score(self, current: int, critical: List[str],
-                                   high: List[Dict], medium: List[Dict]) -> int:
+                                   high: List[Gap], medium: List[Gap]) -> int:
         """Calculate projected score after optimization"""
         
         # Base projection
@@ -767,8 +1190,8 @@ PROFESSIONAL EXPERIENCE
         
         return min(base, 95)
     
-    def _generate_recommendations(self, critical: List[str], high: List[Dict],
-                                  medium: List[Dict], projected: int) -> List[str]:
+    def _generate_recommendations(self, critical: List[str], high: List[Gap],
+                                  medium: List[Gap], projected: int) -> List[str]:
         """Generate actionable recommendations"""
         
         recs = []
@@ -786,69 +1209,83 @@ PROFESSIONAL EXPERIENCE
         
         return recs
     
-    def format_analysis(self, analysis: ATSAnalysis, job_title: str, company: str) -> str:
-        """Format analysis in readable output"""
+    def format_analysis(self, analysis: ATSAnalysis, job_title: str, company: str,
+                        cache: bool = True) -> str:
+        """
+        Format analysis in readable output
         
-        output = f"""
-{'='*80}
-                    ADHAM ATS OPTIMIZATION ANALYSIS v2.0
-{'='*80}
+        Reports are memoized on their rendered inputs, so re-rendering the same
+        analysis is a cache hit; pass cache=False to always render afresh.
+        """
+        inputs = self._report_inputs(analysis, job_title, company)
+        return _render_report(inputs) if cache else _render_report.__wrapped__(inputs)
+    
+    def write_analysis(self, fp: TextIO, analysis: ATSAnalysis, job_title: str,
+                       company: str) -> None:
+        """
+        Stream the format_analysis report section by section to a text file object
+        (file, StringIO, HTTP response), without building the whole string first
+        """
+        _write_report(fp, self._report_inputs(analysis, job_title, company))
+    
+    def _report_inputs(self, analysis: ATSAnalysis, job_title: str,
+                       company: str) -> "_ReportInputs":
+        """Collect the fields format_analysis renders into a hashable key"""
+        breakdown = analysis.score_breakdown
+        return _ReportInputs(
+            job_title=job_title,
+            company=company,
+            score=analysis.score,
+            projected=analysis.projected_new_score,
+            hard=breakdown.hard_req.score,
+            keyword=breakdown.keyword_density.score,
+            experience=breakdown.experience.score,
+            quantified=breakdown.quantified.score,
+            soft=breakdown.soft_skills.score,
+            critical_gaps=tuple(analysis.critical_gaps),
+            high_gaps=tuple((g.keyword, g.frequency) for g in analysis.high_priority_gaps),
+            analogous=tuple(
+                (a["cv_experience"], a["job_requirement"], a["credit"])
+                for a in analysis.analogous_experience
+            ),
+            recommendations=tuple(analysis.recommendations),
+            has_gaps=bool(analysis.critical_gaps or analysis.high_priority_gaps
+                          or analysis.medium_priority_gaps)
+        )
 
-JOB: {job_title} at {company}
 
-{'='*80}
-                    📊 CURRENT ATS SCORE: {analysis.score}/100
-{'='*80}
+class _ReportInputs(NamedTuple):
+    """Everything format_analysis renders; doubles as the report cache key"""
+    job_title: str
+    company: str
+    score: int
+    projected: int
+    hard: int
+    keyword: int
+    experience: int
+    quantified: int
+    soft: int
+    critical_gaps: Tuple[str, ...]
+    high_gaps: Tuple[Tuple[str, int], ...]
+    analogous: Tuple[Tuple[str, str, str], ...]
+    recommendations: Tuple[str, ...]
+    has_gaps: bool
 
-Score Breakdown:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Hard Requirements:          {analysis.score_breakdown['Hard Requirements']['score']}/30
-Keyword Density:           {analysis.score_breakdown['Keyword Density']['score']}/25
-Experience Relevance:      {analysis.score_breakdown['Experience Relevance']['score']}/20
-Quantified Impact:         {analysis.score_breakdown['Quantified Impact']['score']}/15
-Soft Skills & Culture:      {analysis.score_breakdown['Soft Skills & Culture']['score']}/10
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-"""
-        
-        if analysis.critical_gaps:
-            output += f"""🚨 CRITICAL GAPS (Auto-Rejection Risk)
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-            for gap in analysis.critical_gaps:
-                output += f"• {gap}\n"
-            output += "\n"
-        
-        if analysis.high_priority_gaps:
-            output += f"""⚠️ HIGH PRIORITY GAPS (10-15 point impact)
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Critical Keywords (Weight 3):
-| Keyword     | Job Mentions | CV Mentions | Points Lost |
-|-------------|--------------|-------------|-------------|
-"""
-            for gap in analysis.high_priority_gaps:
-                output += f"| {gap['keyword']:<11} | {gap['frequency']:<12} | 0           | -9          |\n"
-            output += "\n"
-        
-        if analysis.analogous_experience:
-            output += f"""🎯 ANALOGOUS EXPERIENCE OPPORTUNITIES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-            for analog in analysis.analogous_experience:
-                output += f"• CV: {analog['cv_experience']} ←→ Job: {analog['job_requirement']} ({analog['credit']})\n"
-            output += "\n"
-        
-        output += f"""📈 PROJECTED SCORE: {analysis.projected_new_score}/100
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Improvement: +{analysis.projected_new_score - analysis.score} points
+@lru_cache(maxsize=128)
+def _render_report(inputs: _ReportInputs) -> str:
+    """Render the ADHAM text report to a string"""
+    return _report_template(inputs.has_gaps).render(inputs._asdict())
 
-"""
-        
-        for rec in analysis.recommendations:
-            output += f"• {rec}\n"
-        
-        return output
+
+def _write_report(out: TextIO, inputs: _ReportInputs) -> None:
+    """Write the ADHAM text report to a text file object, chunk by chunk"""
+    out.writelines(_report_template(inputs.has_gaps).generate(inputs._asdict()))
 
 
-# Singleton instance
-adham_analyzer = ADHAMAnalyzer()
+def __getattr__(name: str):
+    """Build the adham_analyzer singleton on first access (PEP 562)"""
+    if name == "adham_analyzer":
+        instance = globals()["adham_analyzer"] = ADHAMAnalyzer()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
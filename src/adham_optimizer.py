@@ -4,28 +4,150 @@ ADHAM Automated Optimization Engine
 Automatically applies ATS recommendations to generate optimized CV
 """
 
-import re
-from typing import Dict, List, Optional
-from dataclasses import dataclass
-from jinja2 import Template
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 
 from adham_analyzer import ADHAMAnalyzer, ATSAnalysis
 from cv_optimizer import ProfileDatabase
 from pdf_exporter import pdf_exporter
+from adham_patterns import (
+    KEYWORD_VOCABULARY, keyword_hits, TECH_HINT_REGEX, ACTION_FIT_REGEX,
+    KEYWORD_FIT_REGEX, SENIOR_REGEX
+)
 
 
-@dataclass
+# Leadership skills added when a job keyword contains their lowercase form
+_LEADERSHIP_TERMS = tuple(
+    (term, term.lower())
+    for term in ('Strategic Leadership', 'Vendor Management', 'Stakeholder Management')
+)
+
+# Cap on the technical skills list of an optimized profile
+_MAX_TECHNICAL_SKILLS = 15
+
+
+class _AchievementIndex:
+    """
+    Profile achievements lowercased once, with the position of the first
+    achievement containing each keyword found on first lookup and then reused
+    """
+    __slots__ = ("achievements", "lowered", "first")
+    
+    def __init__(self, profile: Dict):
+        self.achievements = [ach for exp in profile.get('experience', [])
+                             for ach in exp.get('achievements', [])]
+        self.lowered = [ach.lower() for ach in self.achievements]
+        self.first: Dict[str, int] = {}
+    
+    def position(self, keyword: str) -> int:
+        """Index of the first achievement containing keyword (len when none does)"""
+        pos = self.first.get(keyword)
+        if pos is None:
+            pos = self.first[keyword] = next(
+                (i for i, ach in enumerate(self.lowered) if keyword in ach),
+                len(self.lowered)
+            )
+        return pos
+
+
+# Master profile, loaded once and shared by every optimizer instance
+_PROFILE_DB = ProfileDatabase()
+
+
+@dataclass(slots=True)
 class OptimizedApplication:
-    """Complete optimized application package"""
+    """
+    Complete optimized application package
+    
+    The CV text is built from optimized_profile on first access of
+    optimized_cv_text, so callers that only use the PDFs never render it.
+    """
     original_score: int
     optimized_score: int
     improvements: List[str]
-    optimized_cv_text: str
+    optimized_profile: Dict
+    job_title: str
+    company: str
+    generated: str  # optimization date, YYYY-MM-DD
     optimized_cv_pdf: str
     cover_letter: str
     cover_letter_pdf: str
     recommendations: List[str]
+    _cv_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def optimized_cv_text(self) -> str:
+        """Optimized CV as text (rendered once, then reused)"""
+        if self._cv_text is None:
+            self._cv_text = _build_optimized_cv(
+                self.optimized_profile, self.job_title, self.company, self.generated
+            )
+        return self._cv_text
+
+
+def _build_optimized_cv(profile: Dict, job_title: str, company: str,
+                        generated: str) -> str:
+    """Build complete optimized CV text (generated: the optimization date)"""
+    
+    parts = [f"""
+================================================================================
+                    OPTIMIZED CV - {job_title}
+                    {company}
+                    Generated: {generated}
+================================================================================
+
+PROFESSIONAL SUMMARY
+--------------------------------------------------------------------------------
+{profile.get('summary', '')}
+
+CORE COMPETENCIES
+--------------------------------------------------------------------------------
+"""]
+    # Skills sections
+    for category, skills in profile.get('core_skills', {}).items():
+        if skills:
+            parts.append(f"\n{category.upper().replace('_', ' ')}:\n")
+            parts.extend(f"  • {skill}\n" for skill in skills[:10])
+    
+    parts.append("""
+PROFESSIONAL EXPERIENCE
+--------------------------------------------------------------------------------
+""")
+    for exp in profile.get('experience', []):
+        parts.append(f"""
+{exp.get('title', '')}
+{exp.get('company', '')} | {exp.get('period', '')} | {exp.get('location', '')}
+
+""")
+        parts.extend(f"  • {ach}\n" for ach in exp.get('achievements', [])[:5])
+    
+    parts.append("""
+EDUCATION
+--------------------------------------------------------------------------------
+""")
+    parts.extend(
+        f"  • {edu.get('degree', '')} | {edu.get('institution', edu.get('school', ''))} | {edu.get('year', '')}\n"
+        for edu in profile.get('education', [])
+    )
+    
+    parts.append("""
+CERTIFICATIONS
+--------------------------------------------------------------------------------
+""")
+    parts.extend(f"  • {cert}\n" for cert in profile.get('certifications', []))
+    
+    parts.append("""
+================================================================================
+                    END OF OPTIMIZED CV
+================================================================================
+""")
+    
+    return "".join(parts)
 
 
 class ADHAMOptimizer:
@@ -37,7 +159,7 @@ class ADHAMOptimizer:
     
     def __init__(self):
         self.analyzer = ADHAMAnalyzer()
-        self.profile_db = ProfileDatabase()
+        self.profile_db = _PROFILE_DB
     
     def optimize(self, job_posting: str, job_title: str, company: str) -> OptimizedApplication:
         """
@@ -54,6 +176,7 @@ class ADHAMOptimizer:
         
         # Load profile
         profile = self.profile_db.data
+        job_lower = job_posting.lower()
         cv_text = self._build_cv_text(profile)
         
         # Step 1: Analyze
@@ -61,10 +184,9 @@ class ADHAMOptimizer:
         original_score = analysis.score
         
         # Step 2: Generate optimized sections
-        optimized_profile = self._apply_optimizations(profile, analysis, job_posting)
+        optimized_profile = self._apply_optimizations(profile, analysis, job_lower)
         
-        # Step 3: Build optimized CV text
-        optimized_cv_text = self._build_optimized_cv(optimized_profile, job_title, company)
+        # Step 3: Optimized CV text is rendered lazily by OptimizedApplication
         
         # Step 4: Generate cover letter
         cover_letter = self._generate_cover_letter(optimized_profile, job_title, company, job_posting)
@@ -83,16 +205,39 @@ class ADHAMOptimizer:
             original_score=original_score,
             optimized_score=analysis.projected_new_score,
             improvements=improvements,
-            optimized_cv_text=optimized_cv_text,
+            optimized_profile=optimized_profile,
+            job_title=job_title,
+            company=company,
+            generated=datetime.now().strftime('%Y-%m-%d'),
             optimized_cv_pdf=cv_pdf,
             cover_letter=cover_letter,
             cover_letter_pdf=cl_pdf,
             recommendations=recommendations
         )
     
+    def optimize_batch(self, jobs: List[Tuple[str, str, str]],
+                       max_workers: Optional[int] = None) -> List[OptimizedApplication]:
+        """
+        Optimize many (job_posting, job_title, company) triples in parallel.
+        
+        Jobs are sharded across worker processes. Each worker receives a copy of
+        this optimizer once, when it starts, so subclasses and differently configured
+        instances batch exactly as they optimize(); results come back in input order.
+        A single job (or max_workers=1) runs in this process.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if len(jobs) <= 1 or workers == 1:
+            return [self.optimize(*job) for job in jobs]
+        
+        workers = min(workers, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_optimize_job, jobs,
+                                     chunksize=-(-len(jobs) // workers)))
+    
     def _build_cv_text(self, profile: Dict) -> str:
         """Build CV text from profile for analysis"""
-        cv_text = f"""
+        parts = [f"""
 {profile['name']}
 {profile['title']}
 
@@ -100,92 +245,71 @@ SUMMARY
 {profile['summary']}
 
 EXPERIENCE
-"""
+"""]
         for exp in profile.get('experience', []):
-            cv_text += f"""
+            parts.append(f"""
 {exp['title']} at {exp['company']}
 {exp['period']} | {exp['location']}
-"""
-            for ach in exp.get('achievements', []):
-                cv_text += f"- {ach}\n"
+""")
+            parts.extend(f"- {ach}\n" for ach in exp.get('achievements', []))
         
-        cv_text += "\nCERTIFICATIONS\n"
-        for cert in profile.get('certifications', []):
-            cv_text += f"- {cert}\n"
+        parts.append("\nCERTIFICATIONS\n")
+        parts.extend(f"- {cert}\n" for cert in profile.get('certifications', []))
         
-        return cv_text
+        return "".join(parts)
     
     def _apply_optimizations(self, profile: Dict, analysis: ATSAnalysis, 
-                           job_posting: str) -> Dict:
-        """Apply all optimization recommendations to profile"""
-        
-        optimized = profile.copy()
+                           job_lower: str) -> Dict:
+        """
+        Apply all optimization recommendations to profile (job posting lowercased once).
+        Returns a new profile dict; the shared master profile is never modified.
+        """
         
         # Extract job keywords
-        keywords = self._extract_job_keywords(job_posting)
-        
-        # 1. Optimize Summary
-        optimized['summary'] = self._optimize_summary(
-            profile.get('summary', ''),
-            keywords,
-            analysis,
-            job_posting
-        )
-        
-        # 2. Add missing keywords to skills
-        optimized = self._optimize_skills(optimized, keywords, analysis)
-        
-        # 3. Optimize experience bullets
-        optimized['experience'] = self._optimize_experience(
-            profile.get('experience', []),
-            keywords,
-            analysis,
-            job_posting
-        )
-        
-        return optimized
+        keywords = self._extract_job_keywords(job_lower)
+        
+        return {
+            **profile,
+            # 1. Optimize Summary
+            'summary': self._optimize_summary(
+                profile.get('summary', ''),
+                keywords,
+                analysis,
+                job_lower
+            ),
+            # 2. Add missing keywords to skills
+            'core_skills': self._optimize_skills(
+                profile.get('core_skills', {}), keywords, analysis
+            ),
+            # 3. Optimize experience bullets
+            'experience': self._optimize_experience(
+                profile.get('experience', []),
+                keywords,
+                analysis,
+                job_lower
+            )
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_job_keywords(job_lower: str) -> Tuple[str, ...]:
+        """
+        Extract important keywords from the lowercased job posting
+        (memoized: batch runs often re-optimize the same posting).
+        Terms keep vocabulary order, so keywords[:3] is the same on every run.
+        """
+        hits = keyword_hits(job_lower)
+        return tuple(term for term in KEYWORD_VOCABULARY if term in hits)
     
-    def _extract_job_keywords(self, job_posting: str) -> List[str]:
-        """Extract important keywords from job posting"""
-        text = job_posting.lower()
-        keywords = []
-        
-        # Technical terms
-        technical = [
-            'smart metering', 'ami', 'iot', 'enterprise integration', 'cybersecurity',
-            'scalability', 'interoperability', 'cloud', 'aws', 'azure',
-            'digital transformation', 'ai', 'ml', 'machine learning',
-            'agile', 'scrum', 'pmp', 'itil', 'six sigma',
-            'programme management', 'vendor management', 'stakeholder management',
-            'strategic planning', 'roadmap', 'architecture', 'technical strategy'
-        ]
-        
-        for term in technical:
-            if term in text:
-                keywords.append(term)
-        
-        # Action verbs
-        action_verbs = [
-            'lead', 'manage', 'oversee', 'direct', 'coordinate',
-            'implement', 'develop', 'build', 'create', 'drive',
-            'ensure', 'optimize', 'improve', 'transform', 'deliver'
-        ]
-        
-        for verb in action_verbs:
-            if verb in text:
-                keywords.append(verb)
-        
-        return list(set(keywords))
-    
-    def _optimize_summary(self, current_summary: str, keywords: List[str],
-                         analysis: ATSAnalysis, job_posting: str) -> str:
+    def _optimize_summary(self, current_summary: str, keywords: Tuple[str, ...],
+                         analysis: ATSAnalysis, job_lower: str) -> str:
         """Optimize professional summary with job-specific keywords"""
         
         optimized = current_summary.strip()
         
         # Get high priority missing keywords
-        high_kw = [g['keyword'] for g in analysis.high_priority_gaps[:3]]
-        medium_kw = [g['keyword'] for g in analysis.medium_priority_gaps[:2]]
+        high_kw = [g.keyword for g in analysis.high_priority_gaps[:3]]
+        medium_kw = [g.keyword for g in analysis.medium_priority_gaps[:2]]
         all_kw = high_kw + medium_kw
         
         if all_kw:
@@ -193,51 +317,50 @@ EXPERIENCE
             kw_phrase = ', '.join(all_kw[:3])
             
             # Detect tone from job posting
-            if 'strategic' in job_posting.lower():
+            if 'strategic' in job_lower:
                 optimized = f"{optimized} Strategic leader with proven expertise in {kw_phrase}."
-            elif 'technical' in job_posting.lower():
+            elif 'technical' in job_lower:
                 optimized = f"{optimized} Technical expert with deep experience in {kw_phrase}."
             else:
                 optimized = f"{optimized} Expert in {kw_phrase}."
         
         return optimized
     
-    def _optimize_skills(self, profile: Dict, keywords: List[str],
+    def _optimize_skills(self, core_skills: Dict, keywords: Tuple[str, ...],
                         analysis: ATSAnalysis) -> Dict:
-        """Add missing keywords to skills sections"""
-        
-        optimized = profile.copy()
-        core_skills = optimized.get('core_skills', {})
+        """Return core_skills with missing keywords added to the skills sections"""
         
-        # Add missing keywords to technical skills
-        technical_skills = set(core_skills.get('technical', []))
+        # Lists keep profile order (deduplicated); sets only answer membership,
+        # so the same skills survive the cap on every run
+        technical = list(dict.fromkeys(core_skills.get('technical', [])))
+        technical_seen = set(technical)
         
-        # Add job-specific technical skills
+        # Add job-specific technical skills until the list is full
         for kw in keywords:
-            if kw not in technical_skills:
-                if any(x in kw for x in ['ai', 'ml', 'cloud', 'data', 'digital', 'automation']):
-                    technical_skills.add(kw)
-        
-        core_skills['technical'] = list(technical_skills)[:15]
-        
-        # Add leadership keywords
-        leadership_skills = set(core_skills.get('leadership', []))
-        leadership_terms = ['Strategic Leadership', 'Vendor Management', 'Stakeholder Management']
-        for term in leadership_terms:
-            if any(term.lower() in kw.lower() for kw in keywords):
-                if term not in leadership_skills:
-                    leadership_skills.add(term)
-        
-        core_skills['leadership'] = list(leadership_skills)
-        
-        optimized['core_skills'] = core_skills
-        return optimized
+            if len(technical) >= _MAX_TECHNICAL_SKILLS:
+                break
+            if kw not in technical_seen and TECH_HINT_REGEX.search(kw):
+                technical.append(kw)
+                technical_seen.add(kw)
+        
+        # Add leadership keywords (job keywords are already lowercase)
+        leadership = list(dict.fromkeys(core_skills.get('leadership', [])))
+        leadership_seen = set(leadership)
+        for term, term_lower in _LEADERSHIP_TERMS:
+            if term not in leadership_seen and any(term_lower in kw for kw in keywords):
+                leadership.append(term)
+                leadership_seen.add(term)
+        
+        return {**core_skills,
+                'technical': technical[:_MAX_TECHNICAL_SKILLS],
+                'leadership': leadership}
     
-    def _optimize_experience(self, experience: List[Dict], keywords: List[str],
-                           analysis: ATSAnalysis, job_posting: str) -> List[Dict]:
+    def _optimize_experience(self, experience: List[Dict], keywords: Tuple[str, ...],
+                           analysis: ATSAnalysis, job_lower: str) -> List[Dict]:
         """Optimize experience bullets with keywords"""
         
         optimized_exp = []
+        job_kw = [k for k in keywords if k in job_lower][:2]
         
         for exp in experience:
             opt_exp = exp.copy()
@@ -246,22 +369,23 @@ EXPERIENCE
             
             for ach in achievements:
                 opt_ach = ach
+                ach_lower = ach.lower()
                 
-                # Add keywords naturally to achievements
-                for kw in keywords[:3]:
-                    if kw not in ach.lower() and len(kw) > 3:
-                        # Check if keyword fits naturally
-                        if any(x in ach.lower() for x in ['lead', 'manage', 'strategic', 'transform']):
+                # Add keywords naturally to achievements (when a keyword fits naturally)
+                if ACTION_FIT_REGEX.search(ach_lower):
+                    for kw in keywords[:3]:
+                        if kw not in ach_lower and len(kw) > 3:
                             opt_ach = f"{ach} - {kw.title()}"
                             break
                 
                 optimized_bullets.append(opt_ach)
             
-            # Add keyword-rich achievement if missing
-            job_kw = [k for k in keywords if k in job_posting.lower()][:2]
+            # Add keyword-rich achievement if missing; job keywords are vocabulary
+            # terms, so one scan of the bullets tells which are already present
+            present = keyword_hits("\n".join(optimized_bullets).lower())
             for kw in job_kw:
-                if kw not in str(optimized_bullets).lower():
-                    if any(x in kw for x in ['strategic', 'lead', 'programme']):
+                if kw not in present:
+                    if KEYWORD_FIT_REGEX.search(kw):
                         optimized_bullets.append(
                             f"Strategic {kw.title()} initiatives driving operational excellence"
                         )
@@ -272,102 +396,46 @@ EXPERIENCE
         
         return optimized_exp
     
-    def _build_optimized_cv(self, profile: Dict, job_title: str, company: str) -> str:
-        """Build complete optimized CV text"""
-        
-        cv = f"""
-================================================================================
-                    OPTIMIZED CV - {job_title}
-                    {company}
-                    Generated: {datetime.now().strftime('%Y-%m-%d')}
-================================================================================
-
-PROFESSIONAL SUMMARY
---------------------------------------------------------------------------------
-{profile.get('summary', '')}
-
-CORE COMPETENCIES
---------------------------------------------------------------------------------
-"""
-        # Skills sections
-        for category, skills in profile.get('core_skills', {}).items():
-            if skills:
-                cv += f"\n{category.upper().replace('_', ' ')}:\n"
-                for skill in skills[:10]:
-                    cv += f"  • {skill}\n"
-        
-        cv += """
-PROFESSIONAL EXPERIENCE
---------------------------------------------------------------------------------
-"""
-        for exp in profile.get('experience', []):
-            cv += f"""
-{exp.get('title', '')}
-{exp.get('company', '')} | {exp.get('period', '')} | {exp.get('location', '')}
-
-"""
-            for ach in exp.get('achievements', [])[:5]:
-                cv += f"  • {ach}\n"
-        
-        cv += """
-EDUCATION
---------------------------------------------------------------------------------
-"""
-        for edu in profile.get('education', []):
-            cv += f"  • {edu.get('degree', '')} | {edu.get('institution', edu.get('school', ''))} | {edu.get('year', '')}\n"
-        
-        cv += """
-CERTIFICATIONS
---------------------------------------------------------------------------------
-"""
-        for cert in profile.get('certifications', []):
-            cv += f"  • {cert}\n"
-        
-        cv += """
-================================================================================
-                    END OF OPTIMIZED CV
-================================================================================
-"""
-        
-        return cv
-    
     def _generate_cover_letter(self, profile: Dict, job_title: str, 
                              company: str, job_posting: str) -> str:
         """Generate optimized cover letter"""
         
+        # Shared by every _extract_achievement call below
+        achievements = _AchievementIndex(profile)
+        
         # Detect job type
-        is_senior = any(x in job_title.lower() for x in ['cto', 'vp', 'director', 'chief', 'senior'])
+        is_senior = SENIOR_REGEX.search(job_title.lower()) is not None
         
-        cl = f"""Dear Hiring Manager,
+        parts = ["""Dear Hiring Manager,
 
-"""
+"""]
         
         # Executive opening
         if is_senior:
-            cl += f"""With {profile.get('total_experience_years', 20)}+ years leading enterprise-scale technology initiatives, 
+            parts.append(f"""With {profile.get('total_experience_years', 20)}+ years leading enterprise-scale technology initiatives, 
 I am excited to apply for the {job_title} position at {company}.
 
 My leadership experience spans digital transformation, strategic programme management, 
 and technology innovation across complex stakeholder environments:
 
-• Strategic Vision: {self._extract_achievement(profile, ['transform', 'strategic', 'vision'])}
-• Operational Excellence: {self._extract_achievement(profile, ['efficiency', 'optimize', 'improve'])}
-• Technology Leadership: {self._extract_achievement(profile, ['lead', 'manage', 'oversee'])}
-• Team Building: {self._extract_achievement(profile, ['team', 'build', 'lead'])}
-"""
+• Strategic Vision: {self._extract_achievement(achievements, ['transform', 'strategic', 'vision'])}
+• Operational Excellence: {self._extract_achievement(achievements, ['efficiency', 'optimize', 'improve'])}
+• Technology Leadership: {self._extract_achievement(achievements, ['lead', 'manage', 'oversee'])}
+• Team Building: {self._extract_achievement(achievements, ['team', 'build', 'lead'])}
+""")
         else:
-            cl += f"""With {profile.get('total_experience_years', 20)} years in technology leadership, 
+            parts.append(f"""With {profile.get('total_experience_years', 20)} years in technology leadership, 
 I am excited to apply for the {job_title} position at {company}.
 
 My experience aligns with your requirements:
 
-• Programme Management: {self._extract_achievement(profile, ['program', 'project', 'manage'])}
-• Technical Skills: {self._extract_achievement(profile, ['implement', 'develop', 'build'])}
-• Results-Driven: {self._extract_achievement(profile, ['deliver', 'achieve', 'improve'])}
+• Programme Management: {self._extract_achievement(achievements, ['program', 'project', 'manage'])}
+• Technical Skills: {self._extract_achievement(achievements, ['implement', 'develop', 'build'])}
+• Results-Driven: {self._extract_achievement(achievements, ['deliver', 'achieve', 'improve'])}
 
-"""
+""")
         
-        cl += f"""I am particularly drawn to {company}'s focus on technology innovation and strategic growth. 
+        parts.append(f"""I am particularly drawn to {company}'s focus on technology innovation and strategic growth. 
 My background in {', '.join(list(profile.get('core_skills', {}).get('technical', []))[:3])} 
 positions me to contribute immediately and drive meaningful impact.
 
@@ -377,18 +445,18 @@ I would welcome the opportunity to discuss how my experience can contribute to
 Sincerely,
 {profile.get('name', 'Ahmed Nasr')}
 {profile.get('title', 'Technology Leader')}
-"""
+""")
         
-        return cl
+        return "".join(parts)
     
-    def _extract_achievement(self, profile: Dict, keywords: List[str]) -> str:
-        """Extract achievement containing keywords"""
-        for exp in profile.get('experience', []):
-            for ach in exp.get('achievements', []):
-                for kw in keywords:
-                    if kw in ach.lower():
-                        return ach[:100] + "..." if len(ach) > 100 else ach
-        return "delivering exceptional results"
+    def _extract_achievement(self, achievements: _AchievementIndex,
+                             keywords: List[str]) -> str:
+        """Extract the first achievement (in profile order) containing any keyword"""
+        pos = min(achievements.position(kw) for kw in keywords)
+        if pos == len(achievements.achievements):
+            return "delivering exceptional results"
+        ach = achievements.achievements[pos]
+        return ach[:100] + "..." if len(ach) > 100 else ach
     
     def _export_cv_pdf(self, profile: Dict, job_title: str) -> str:
         """Export optimized CV to PDF"""
@@ -435,35 +503,26 @@ Sincerely,
         return pdf_path
     
     def _flatten_skills(self, profile: Dict) -> List[str]:
-        """Flatten skills from all categories"""
-        all_skills = []
-        for category, skills in profile.get('core_skills', {}).items():
-            all_skills.extend(skills)
-        return all_skills[:20]
+        """Flatten skills from all categories (first 20)"""
+        return list(islice(chain.from_iterable(profile.get('core_skills', {}).values()), 20))
     
     def _convert_experience(self, experience: List[Dict]) -> List[Dict]:
         """Convert experience to PDF format"""
-        converted = []
-        for exp in experience:
-            converted.append({
-                "title": exp.get('title', ''),
-                "company": exp.get('company', ''),
-                "date": exp.get('period', ''),
-                "location": exp.get('location', ''),
-                "bullets": exp.get('achievements', [])[:4]
-            })
-        return converted
+        return [{
+            "title": exp.get('title', ''),
+            "company": exp.get('company', ''),
+            "date": exp.get('period', ''),
+            "location": exp.get('location', ''),
+            "bullets": exp.get('achievements', [])[:4]
+        } for exp in experience]
     
     def _convert_education(self, education: List[Dict]) -> List[Dict]:
         """Convert education to PDF format"""
-        converted = []
-        for edu in education:
-            converted.append({
-                "degree": edu.get('degree', ''),
-                "school": edu.get('institution', edu.get('school', '')),
-                "year": edu.get('year', '')
-            })
-        return converted
+        return [{
+            "degree": edu.get('degree', ''),
+            "school": edu.get('institution', edu.get('school', '')),
+            "year": edu.get('year', '')
+        } for edu in education]
     
     def _calculate_improvements(self, analysis: ATSAnalysis) -> List[str]:
         """Calculate what improvements were made"""
@@ -471,7 +530,7 @@ Sincerely,
         improvements = []
         
         # Summary optimization
-        if analysis.score_breakdown.get('Keyword Density', {}).get('score', 0) < 15:
+        if analysis.score_breakdown.keyword_density.score < 15:
             improvements.append("✅ Enhanced summary with job-specific keywords")
         
         # Skills optimization
@@ -483,7 +542,7 @@ Sincerely,
             improvements.append(f"✅ Injected {len(analysis.medium_priority_gaps)} keywords into experience bullets")
         
         # Quantified achievements
-        if analysis.score_breakdown.get('Quantified Impact', {}).get('score', 0) < 10:
+        if analysis.score_breakdown.quantified.score < 10:
             improvements.append("✅ Strengthened quantified achievements with metrics")
         
         return improvements
@@ -511,7 +570,7 @@ Sincerely,
             )
             if analysis.high_priority_gaps:
                 recommendations.append(
-                    f"  1. Add missing keywords: {[g['keyword'] for g in analysis.high_priority_gaps[:3]]}"
+                    f"  1. Add missing keywords: {[g.keyword for g in analysis.high_priority_gaps[:3]]}"
                 )
             recommendations.append("  2. Consider obtaining missing certifications")
         
@@ -522,8 +581,23 @@ Sincerely,
 adham_optimizer = ADHAMOptimizer()
 
 
-if __name__ == "__main__":
-    # Test automated optimization
+# The optimizer an optimize_batch worker process runs, installed by _init_batch_worker
+_batch_optimizer: Optional[ADHAMOptimizer] = None
+
+
+def _init_batch_worker(optimizer: ADHAMOptimizer) -> None:
+    """optimize_batch worker initializer: keep the calling optimizer for _optimize_job"""
+    global _batch_optimizer
+    _batch_optimizer = optimizer
+
+
+def _optimize_job(job: Tuple[str, str, str]) -> OptimizedApplication:
+    """optimize_batch worker: optimize one job with the batch's optimizer"""
+    return _batch_optimizer.optimize(*job)
+
+
+def _demo() -> None:
+    """Run a sample optimization and print the result"""
     print("="*70)
     print("ADHAM AUTOMATED OPTIMIZATION - TEST")
     print("="*70)
@@ -562,3 +636,7 @@ if __name__ == "__main__":
     print("OPTIMIZED COVER LETTER")
     print("="*70)
     print(result.cover_letter)
+
+
+if __name__ == "__main__":
+    _demo()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+ADHAM shared patterns
+Keyword vocabularies, compiled regexes and Aho-Corasick automata, built once at
+import and shared by ADHAMAnalyzer and ADHAMOptimizer
+"""
+
+import re
+from typing import Iterable
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def build_automaton(terms: Iterable[str]) -> "ahocorasick.Automaton":
+    """Aho-Corasick automaton whose value for each term is the term itself"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+# Job keyword vocabulary: technical terms, then action verbs
+TECHNICAL_TERMS = (
+    'smart metering', 'ami', 'iot', 'enterprise integration', 'cybersecurity',
+    'scalability', 'interoperability', 'cloud', 'aws', 'azure',
+    'digital transformation', 'ai', 'ml', 'machine learning',
+    'agile', 'scrum', 'pmp', 'itil', 'six sigma',
+    'programme management', 'vendor management', 'stakeholder management',
+    'strategic planning', 'roadmap', 'architecture', 'technical strategy'
+)
+
+ACTION_VERBS = (
+    'lead', 'manage', 'oversee', 'direct', 'coordinate',
+    'implement', 'develop', 'build', 'create', 'drive',
+    'ensure', 'optimize', 'improve', 'transform', 'deliver'
+)
+
+KEYWORD_VOCABULARY = TECHNICAL_TERMS + ACTION_VERBS
+
+# One scan finds every vocabulary term occurring anywhere in the text (substring
+# semantics, so "lead" still matches "leadership"). The capture sits in a lookahead,
+# so matches may overlap ("transform" inside "digital transformation"); no term is a
+# prefix of another, so each position yields the only term that can start there.
+KEYWORD_REGEX = re.compile(
+    "(?=(" + "|".join(map(re.escape, KEYWORD_VOCABULARY)) + "))"
+)
+
+KEYWORD_AUTOMATON = build_automaton(KEYWORD_VOCABULARY) if AHOCORASICK_AVAILABLE else None
+
+
+def keyword_hits(text_lower: str) -> set:
+    """KEYWORD_VOCABULARY terms occurring anywhere in text_lower (substring semantics)"""
+    if AHOCORASICK_AVAILABLE:
+        return {term for _, term in KEYWORD_AUTOMATON.iter(text_lower)}
+    return set(KEYWORD_REGEX.findall(text_lower))
+
+
+# Substring checks that recur per keyword, achievement or title, one alternation each
+TECH_HINT_REGEX = re.compile(r'ai|ml|cloud|data|digital|automation')
+ACTION_FIT_REGEX = re.compile(r'lead|manage|strategic|transform')
+KEYWORD_FIT_REGEX = re.compile(r'strategic|lead|programme')
+SENIOR_REGEX = re.compile(r'cto|vp|director|chief|senior')
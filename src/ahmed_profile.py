@@ -1,6 +1,20 @@
 """
 Ahmed Nasr Profile Database - Real data from CV
 """
+import sys
+from types import MappingProxyType
+
+
+def _freeze(value):
+    """Read-only copy: dicts become mapping proxies, lists tuples; short strings are interned"""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str) and len(value) < 256:
+        return sys.intern(value)
+    return value
+
 
 AHMED_PROFILE = {
     "name": "Ahmed Nasr",
@@ -155,3 +169,12 @@ sectors. Adept at leading large-scale digital projects, managing high-performanc
 and delivering transformative business solutions. Proven expertise in scaling operations regionally, 
 implementing cutting-edge technologies, and driving strategic initiatives that align with organizational goals."""
 }
+
+# Shared by every caller, so frozen once at import: safe to alias without defensive copies
+AHMED_PROFILE = _freeze(AHMED_PROFILE)
+SECTOR_SUMMARIES = _freeze(SECTOR_SUMMARIES)
+
+# Lowercased achievements, one tuple per AHMED_PROFILE['experience'] entry, in the same order
+AHMED_ACHIEVEMENTS_LOWER = tuple(
+    tuple(a.lower() for a in exp.get('achievements', ())) for exp in AHMED_PROFILE['experience']
+)
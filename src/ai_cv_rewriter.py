@@ -3,8 +3,172 @@ AI CV Rewriter - GPT-powered content generation for CVs
 """
 import os
 import json
+import random
+import re
+import threading
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import date, datetime
+
+from ahmed_profile import AHMED_PROFILE, AHMED_ACHIEVEMENTS_LOWER
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Weak verb -> power verb replacements for experience bullets
+_POWER_VERBS = {
+    'led': ['Spearheaded', 'Orchestrated', 'Championed', 'Directed'],
+    'managed': ['Steered', 'Oversaw', 'Governed', 'Commanded'],
+    'implemented': ['Deployed', 'Executed', 'Pioneered', 'Established'],
+    'improved': ['Optimized', 'Elevated', 'Transformed', 'Revolutionized'],
+    'created': ['Architected', 'Designed', 'Devised', 'Engineered'],
+    'increased': ['Accelerated', 'Amplified', 'Boosted', 'Maximized'],
+    'reduced': ['Minimized', 'Streamlined', 'Condensed', 'Slashed'],
+    'developed': ['Cultivated', 'Nurtured', 'Fostered', 'Advanced']
+}
+
+# First weak verb in a bullet, as a whole word in any case
+_WEAK_VERB_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _POWER_VERBS)) + r')\b', re.IGNORECASE
+)
+
+# Interview question banks, built once at import. The question dicts are shared
+# by every predict_interview_questions result and must be treated as read-only.
+_ROLE_QUESTIONS = {
+    'pmo': (
+        {
+            'question': 'How do you establish a PMO from scratch?',
+            'framework': 'Use STAR method: Situation (blank slate), Task (build PMO), Action (governance, tools, training), Result (300 projects managed)',
+            'key_points': ['Governance framework', 'Tool selection', 'Change management', 'Metrics definition']
+        },
+        {
+            'question': 'How do you handle conflicting priorities across multiple projects?',
+            'framework': 'Discuss portfolio prioritization, stakeholder alignment, and resource optimization',
+            'key_points': ['OKR alignment', 'Resource allocation', 'Stakeholder communication', 'Risk assessment']
+        }
+    ),
+    'healthtech': (
+        {
+            'question': 'How do you ensure clinical adoption of new technology?',
+            'framework': 'Emphasize change management, training, and demonstrating value to clinicians',
+            'key_points': ['Physician champions', 'Workflow integration', 'Training programs', 'Success metrics']
+        },
+        {
+            'question': 'Describe your experience with healthcare data analytics.',
+            'framework': 'Highlight Health Catalyst, EDW implementation, and clinical outcomes improvement',
+            'key_points': ['Health Catalyst EDW', 'Predictive analytics', 'Clinical decision support', 'ROI measurement']
+        }
+    ),
+    'leadership': (
+        {
+            'question': 'Tell me about a time you led a major transformation.',
+            'framework': 'Use the example from TopMed/SGH: scale, complexity, multi-country, measurable results',
+            'key_points': ['Digital transformation', 'Cross-functional teams', 'Change management', 'Measurable outcomes']
+        },
+        {
+            'question': 'How do you align technology initiatives with business strategy?',
+            'framework': 'Discuss strategic planning, OKRs, stakeholder engagement, and ROI focus',
+            'key_points': ['Strategic alignment', 'Business case development', 'Executive communication', 'Value delivery']
+        }
+    )
+}
+
+_BEHAVIORAL_QUESTIONS = (
+    {
+        'question': 'Tell me about a failure and what you learned.',
+        'framework': 'Be honest, focus on learning and growth, show resilience',
+        'key_points': ['Specific situation', 'Your responsibility', 'Lesson learned', 'How you applied it']
+    },
+    {
+        'question': 'How do you handle stress and tight deadlines?',
+        'framework': 'Discuss prioritization, delegation, and maintaining quality under pressure',
+        'key_points': ['Prioritization methods', 'Team support', 'Communication', 'Self-care']
+    }
+)
+
+_HEALTH_TITLE_WORDS = ('health', 'hospital', 'medical')
+
+# Leading bullet or list number of a job description line: the line must start with
+# a bullet, dash or digit, and the whole run of those, dots and spaces is dropped
+_BULLET_RE = re.compile(r'(?=[•\-\d])[•\-0-9. ]*')
+
+# A quantified result: a percentage, dollar amount, 30K/7M-style count or an n-fold change
+# (a bare 'M' or 'K' anywhere, as in "Management" or "KSA", no longer counts)
+_METRIC_RE = re.compile(r'\d%|\$\d|\b\d+(?:\.\d+)?[MK]\b|fold\b')
+
+# Cover letters kept per AICVRewriter for repeated (profile, job posting) requests
+_COVER_LETTER_CACHE_SIZE = 128
+
+# Requirement keyword buckets (checked in order, substring match in any case) and
+# the cover-letter paragraph for each; {req:.30} is the requirement's first 30 chars
+_REQUIREMENT_MATCHES = (
+    (re.compile(r'leadership|team|manage', re.IGNORECASE),
+     "Your requirement for {first_word} leadership aligns perfectly with my experience leading cross-functional teams of 50+ professionals across multiple countries, most recently at Saudi German Hospital Group where I established PMO frameworks managing $50M+ in projects."),
+    (re.compile(r'healthcare|health|clinical', re.IGNORECASE),
+     "Regarding {req:.30}..., I have successfully implemented HealthTech solutions across 12+ hospital facilities, including AI-driven Clinical Decision Support systems and Health Catalyst analytics platforms that improved patient outcomes by 35%."),
+    (re.compile(r'digital|transformation|technology', re.IGNORECASE),
+     "My background in {req:.30}... includes leading enterprise-wide digital transformations at both PaySky and El Araby Group, where I delivered SAP S/4HANA implementations and modernized operational systems serving millions of users."),
+    (re.compile(r'strategy|strategic', re.IGNORECASE),
+     "In terms of {req:.30}..., I have advised C-suite executives on multi-year strategic plans, market expansion strategies, and digital innovation roadmaps that delivered measurable ROI across FinTech and healthcare sectors."),
+)
+
+_DEFAULT_REQUIREMENT_MATCH = "Your requirement for {req:.40}... resonates with my experience driving operational excellence and delivering complex initiatives on time and under budget across diverse industries."
+
+# CV variant headline and summary per focus area; unknown areas fall back to general
+_HEADLINE_TEMPLATES = {
+    'healthtech': "HealthTech Digital Transformation Leader | {certifications}",
+    'fintech': "FinTech Strategy & Operations Executive | {certifications}",
+    'pmo': "Strategic PMO Leader & Change Agent | {certifications}",
+    'general': "Digital Transformation Expert & Regional Engagement Leader | {certifications}"
+}
+
+_SUMMARY_TEMPLATES = {
+    'healthtech': "Results-driven HealthTech executive with 20+ years transforming healthcare delivery through AI, data analytics, and digital innovation. Proven track record implementing enterprise-scale solutions across {company}'s focus areas.",
+    'fintech': "Strategic FinTech leader with deep expertise in digital payments, banking transformation, and regulatory compliance. Demonstrated success scaling operations and driving revenue growth in competitive markets.",
+    'pmo': "Strategic PMO leader specializing in large-scale transformation initiatives. Expert in establishing governance frameworks, optimizing project portfolios, and delivering measurable business outcomes across global organizations."
+}
+
+# Achievement keywords per focus area, matched as substrings of the lowercased
+# achievement ("ai" also matches "maintained", as the per-word checks always did)
+_FOCUS_RES = {
+    'healthtech': re.compile(r'health|hospital|patient|clinical|ai|analytics'),
+    'fintech': re.compile(r'revenue|growth|digital|payment|banking'),
+    'pmo': re.compile(r'project|portfolio|pmo|framework|team')
+}
+
+
+def _headline(focus_area: str, certifications) -> str:
+    """Variant headline; not cached, as profiles may list certifications (unhashable)"""
+    template = _HEADLINE_TEMPLATES.get(focus_area, _HEADLINE_TEMPLATES['general'])
+    return template.format(certifications=certifications)
+
+
+@lru_cache(maxsize=64)
+def _summary(focus_area: str, target_company: str) -> str:
+    """Variant summary for a focus area in _SUMMARY_TEMPLATES, composed once per company"""
+    return _SUMMARY_TEMPLATES[focus_area].format(company=target_company)
+
+
+@lru_cache(maxsize=1)
+def _date_stamp(day: date) -> str:
+    """Letter-header date; keyed on the local date, so it is formatted once a day"""
+    return day.strftime('%B %d, %Y')
+
+
+def _experience_fingerprint(experience) -> str:
+    """Digest of a profile's experience entries (mapping proxies and tuples included)"""
+    canonical = json.dumps(experience, sort_keys=True, default=dict)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+# AHMED_PROFILE is frozen, so its fingerprint never changes
+_AHMED_PROFILE_KEY = _experience_fingerprint(AHMED_PROFILE['experience'])
+
 
 class AICVRewriter:
     """
@@ -17,45 +181,72 @@ class AICVRewriter:
     
     def __init__(self):
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        self.variants_file = os.path.join(self.data_dir, 'cv_variants.json')
-        self.variants = self._load_json(self.variants_file, [])
+        # Append-only log: one JSON variant per line, so saving a variant writes only that variant
+        self.variants_file = os.path.join(self.data_dir, 'cv_variants.jsonl')
+        # Loaded on first access to self.variants; most methods never read it
+        self._variants: Optional[List[Dict]] = None
+        self._variants_mtime: Optional[int] = None
+        # Composed cover letters (all but the dated header), least recently used first
+        self._cover_letters: OrderedDict = OrderedDict()
+        # mission_control shares one rewriter across Flask's request threads
+        self._cover_letters_lock = threading.Lock()
+    
+    @property
+    def variants(self) -> List[Dict]:
+        """Saved variants, read on first access and re-read only when the file changes"""
+        mtime = self._mtime(self.variants_file)
+        if self._variants is None or mtime != self._variants_mtime:
+            if self._variants is None and mtime is None:
+                self._migrate_legacy_variants()
+                mtime = self._mtime(self.variants_file)
+            self._variants = self._load_jsonl(self.variants_file)
+            self._variants_mtime = mtime
+        return self._variants
+    
+    def _migrate_legacy_variants(self):
+        """Copy variants from the old whole-file cv_variants.json into the log once"""
+        legacy_file = os.path.join(self.data_dir, 'cv_variants.json')
+        for variant in self._load_json(legacy_file, []):
+            self._append_jsonl(self.variants_file, variant)
+    
+    @staticmethod
+    def _mtime(filepath: str) -> Optional[int]:
+        try:
+            return os.stat(filepath).st_mtime_ns
+        except FileNotFoundError:
+            return None
     
     def _load_json(self, filepath: str, default):
         if os.path.exists(filepath):
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(filepath, 'r') as f:
                 return json.load(f)
         return default
     
-    def _save_json(self, filepath: str, data):
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _load_jsonl(self, filepath: str) -> List:
+        if not os.path.exists(filepath):
+            return []
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(filepath, 'rb') as f:
+            return [loads(line) for line in f if line.strip()]
+    
+    def _append_jsonl(self, filepath: str, record):
+        line = orjson.dumps(record) if ORJSON_AVAILABLE else json.dumps(record).encode()
+        with open(filepath, 'ab') as f:
+            f.write(line + b'\n')
     
     def rewrite_experience_bullet(self, original: str, metric: str = None) -> str:
         """
         Rewrite experience bullet to be more impactful
         Uses templates optimized for executive resumes
         """
-        # Power verb mapping
-        power_verbs = {
-            'led': ['Spearheaded', 'Orchestrated', 'Championed', 'Directed'],
-            'managed': ['Steered', 'Oversaw', 'Governed', 'Commanded'],
-            'implemented': ['Deployed', 'Executed', 'Pioneered', 'Established'],
-            'improved': ['Optimized', 'Elevated', 'Transformed', 'Revolutionized'],
-            'created': ['Architected', 'Designed', 'Devised', 'Engineered'],
-            'increased': ['Accelerated', 'Amplified', 'Boosted', 'Maximized'],
-            'reduced': ['Minimized', 'Streamlined', 'Condensed', 'Slashed'],
-            'developed': ['Cultivated', 'Nurtured', 'Fostered', 'Advanced']
-        }
-        
-        # Find and replace weak verbs
-        lower_original = original.lower()
+        # Replace the first weak verb with a power verb
         result = original
-        
-        for weak, strong_list in power_verbs.items():
-            if weak in lower_original:
-                import random
-                result = result.replace(weak, random.choice(strong_list), 1)
-                break
+        if (weak := _WEAK_VERB_RE.search(original)):
+            strong = random.choice(_POWER_VERBS[weak.group(1).lower()])
+            result = original[:weak.start()] + strong + original[weak.end():]
         
         # Add metric if provided
         if metric and '%' not in result and '$' not in result:
@@ -78,71 +269,132 @@ class AICVRewriter:
         }
         
         # Generate tailored headline
-        headlines = {
-            'healthtech': f"HealthTech Digital Transformation Leader | {profile.get('certifications', '')}",
-            'fintech': f"FinTech Strategy & Operations Executive | {profile.get('certifications', '')}",
-            'pmo': f"Strategic PMO Leader & Change Agent | {profile.get('certifications', '')}",
-            'general': f"Digital Transformation Expert & Regional Engagement Leader | {profile.get('certifications', '')}"
-        }
-        variant['content']['headline'] = headlines.get(focus_area, headlines['general'])
+        variant['content']['headline'] = _headline(focus_area, profile.get('certifications', ''))
         
-        # Generate tailored summary
-        summaries = {
-            'healthtech': f"Results-driven HealthTech executive with 20+ years transforming healthcare delivery through AI, data analytics, and digital innovation. Proven track record implementing enterprise-scale solutions across {target_company}'s focus areas.",
-            'fintech': f"Strategic FinTech leader with deep expertise in digital payments, banking transformation, and regulatory compliance. Demonstrated success scaling operations and driving revenue growth in competitive markets.",
-            'pmo': f"Strategic PMO leader specializing in large-scale transformation initiatives. Expert in establishing governance frameworks, optimizing project portfolios, and delivering measurable business outcomes across global organizations.",
-            'general': profile.get('summary', '')
-        }
-        variant['content']['summary'] = summaries.get(focus_area, summaries['general'])
+        # Generate tailored summary; the general variant keeps the profile's own
+        if focus_area in _SUMMARY_TEMPLATES:
+            variant['content']['summary'] = _summary(focus_area, target_company)
+        else:
+            variant['content']['summary'] = profile.get('summary', '')
         
-        # Tailor experience bullets
+        # Tailor experience bullets. Only the position of each experience entry and the
+        # indexes of its highlighted achievements are stored, with a fingerprint of the
+        # profile's experience; _rehydrate_variant joins them back against the profile.
+        focus_re = _FOCUS_RES.get(focus_area)
+        # The shared profile comes with its achievements already lowercased
+        lowered_by_exp = AHMED_ACHIEVEMENTS_LOWER if profile is AHMED_PROFILE else None
         tailored_experience = []
-        for exp in profile.get('experience', []):
-            tailored_exp = exp.copy()
+        for n, exp in enumerate(profile.get('experience', [])):
             achievements = exp.get('achievements', [])
             
             # Select most relevant achievements based on focus
-            if focus_area == 'healthtech':
-                relevant = [a for a in achievements if any(word in a.lower() 
-                    for word in ['health', 'hospital', 'patient', 'clinical', 'ai', 'analytics'])]
-            elif focus_area == 'fintech':
-                relevant = [a for a in achievements if any(word in a.lower() 
-                    for word in ['revenue', 'growth', 'digital', 'payment', 'banking'])]
-            elif focus_area == 'pmo':
-                relevant = [a for a in achievements if any(word in a.lower() 
-                    for word in ['project', 'portfolio', 'pmo', 'framework', 'team'])]
+            if focus_re is not None:
+                if lowered_by_exp is not None:
+                    lowered = lowered_by_exp[n]
+                else:
+                    lowered = [a.lower() for a in achievements]
+                relevant = [i for i, a in enumerate(lowered) if focus_re.search(a)]
             else:
-                relevant = achievements[:3]
+                relevant = []
             
-            tailored_exp['highlighted_achievements'] = relevant[:3] if relevant else achievements[:3]
-            tailored_experience.append(tailored_exp)
+            tailored_experience.append({
+                'experience_idx': n,
+                'highlighted_idx': relevant[:3] or list(range(min(3, len(achievements))))
+            })
         
         variant['content']['experience'] = tailored_experience
+        variant['profile_key'] = self._profile_key(profile)
         
         # Save variant
         self.variants.append(variant)
-        self._save_json(self.variants_file, self.variants)
+        self._append_jsonl(self.variants_file, variant)
+        # Our own append is already in memory; only outside writes should trigger a re-read
+        self._variants_mtime = self._mtime(self.variants_file)
+        
+        return self._rehydrate_variant(variant, profile)
+    
+    def get_variant(self, variant_id: str, profile: Dict) -> Optional[Dict]:
+        """
+        Saved variant as generate_cv_variant returned it, rehydrated from the profile it
+        was generated from; None if no variant has that id
+        """
+        variant = next((v for v in self.variants if v.get('id') == variant_id), None)
+        if variant is None:
+            return None
+        return self._rehydrate_variant(variant, profile)
+    
+    @staticmethod
+    def _profile_key(profile: Dict) -> str:
+        """Fingerprint of the profile's experience, which stored variants index into"""
+        if profile is AHMED_PROFILE:
+            return _AHMED_PROFILE_KEY
+        return _experience_fingerprint(profile.get('experience', []))
+    
+    def _rehydrate_variant(self, variant: Dict, profile: Dict) -> Dict:
+        """Stored variant with full experience entries in place of the stored indexes"""
+        if 'profile_key' not in variant:
+            # Saved before variants stored indexes: already full experience entries
+            return variant
+        if variant['profile_key'] != self._profile_key(profile):
+            raise ValueError(
+                f"{variant['id']} was generated from a different profile or an earlier "
+                f"version of this one"
+            )
         
-        return variant
+        experience = profile.get('experience', [])
+        tailored_experience = []
+        for entry in variant['content']['experience']:
+            exp = experience[entry['experience_idx']]
+            achievements = exp.get('achievements', [])
+            tailored_exp = exp.copy()
+            tailored_exp['highlighted_achievements'] = [achievements[i] for i in entry['highlighted_idx']]
+            tailored_experience.append(tailored_exp)
+        
+        rehydrated = {k: v for k, v in variant.items() if k != 'profile_key'}
+        rehydrated['content'] = {**variant['content'], 'experience': tailored_experience}
+        return rehydrated
     
     def generate_cover_letter(self, profile: Dict, job_title: str, company: str, 
                              job_description: str) -> str:
         """
         Generate tailored cover letter
         """
-        # Extract key requirements from job description
-        requirements = self._extract_requirements(job_description)
-        
         # Build cover letter sections
         header = f"""{profile.get('name', '')}
 {profile.get('contact', {}).get('email', '')} | {profile.get('contact', {}).get('uae', '').split('+')[-1].strip()} | {profile.get('contact', {}).get('egypt', '').split('+')[-1].strip()}
-{datetime.now().strftime('%B %d, %Y')}
+{_date_stamp(date.today())}
 
 Hiring Manager
 {company}
 
 """
         
+        # Everything below the dated header depends only on the posting and the profile,
+        # so a posting that comes back (the UI re-requests it) reuses the composed text
+        key_achievement = self._get_key_achievement(profile)
+        jd_digest = hashlib.blake2b(job_description.encode(), digest_size=16).hexdigest()
+        cache_key = (profile.get('name', ''), key_achievement, job_title, company, jd_digest)
+        with self._cover_letters_lock:
+            letter = self._cover_letters.get(cache_key)
+            if letter is not None:
+                self._cover_letters.move_to_end(cache_key)
+        if letter is None:
+            # Composed outside the lock; two threads may both compose the same letter
+            letter = self._compose_cover_letter(profile, job_title, company, job_description,
+                                                key_achievement)
+            with self._cover_letters_lock:
+                self._cover_letters[cache_key] = letter
+                if len(self._cover_letters) > _COVER_LETTER_CACHE_SIZE:
+                    self._cover_letters.popitem(last=False)
+        
+        return header + letter
+    
+    def _compose_cover_letter(self, profile: Dict, job_title: str, company: str,
+                              job_description: str, key_achievement: str) -> str:
+        """Cover letter from the salutation to the signature"""
+        # Extract key requirements from job description
+        requirements = self._extract_requirements(job_description)
+        
         opening = f"""Dear Hiring Manager,
 
 I am writing to express my strong interest in the {job_title} position at {company}. With over 20 years of experience driving digital transformation across healthcare and FinTech sectors, I am excited about the opportunity to contribute to {company}'s innovative mission.
@@ -156,10 +408,11 @@ I am writing to express my strong interest in the {job_title} position at {compa
             if match:
                 body_paragraphs.append(f"{match}\n")
         
+        # Paragraphs end in a newline, so this leaves one blank line between them
         body = "\n".join(body_paragraphs)
         
         closing = f"""
-I am particularly drawn to {company} because of {'your commitment to innovation in healthcare technology' if 'health' in company.lower() or 'health' in job_title.lower() else 'your market leadership and growth trajectory'}. I am confident that my track record of {self._get_key_achievement(profile)} would enable me to make an immediate impact on your team.
+I am particularly drawn to {company} because of {'your commitment to innovation in healthcare technology' if 'health' in company.lower() or 'health' in job_title.lower() else 'your market leadership and growth trajectory'}. I am confident that my track record of {key_achievement} would enable me to make an immediate impact on your team.
 
 I would welcome the opportunity to discuss how my background in digital transformation, team leadership, and strategic planning aligns with {company}'s goals. Thank you for considering my application.
 
@@ -168,49 +421,47 @@ Sincerely,
 {profile.get('name', '')}
 """
         
-        return header + opening + body + closing
+        return ''.join((opening, body, closing))
     
     def _extract_requirements(self, job_description: str) -> List[str]:
         """Extract key requirements from job description"""
         # Simple extraction - look for bullet points or numbered lists
-        lines = job_description.split('\n')
         requirements = []
         
-        for line in lines:
+        for line in job_description.split('\n'):
             line = line.strip()
-            if line.startswith('•') or line.startswith('-') or line[0].isdigit():
-                if len(line) > 20:  # Meaningful requirement
-                    requirements.append(line.lstrip('•-0123456789. '))
+            if len(line) > 20 and (bullet := _BULLET_RE.match(line)):  # Meaningful requirement
+                requirement = line[bullet.end():]
+                if not requirement:  # A separator such as "------", nothing but bullet
+                    continue
+                requirements.append(requirement)
+                if len(requirements) == 5:  # Top 5 requirements
+                    break
         
-        return requirements[:5]  # Top 5 requirements
+        return requirements
     
     def _find_matching_experience(self, requirement: str, profile: Dict) -> str:
         """Find experience that matches a requirement"""
-        req_lower = requirement.lower()
-        
-        # Keyword matching
-        if any(word in req_lower for word in ['leadership', 'team', 'manage']):
-            return f"Your requirement for {requirement.split()[0]} leadership aligns perfectly with my experience leading cross-functional teams of 50+ professionals across multiple countries, most recently at Saudi German Hospital Group where I established PMO frameworks managing $50M+ in projects."
-        
-        if any(word in req_lower for word in ['healthcare', 'health', 'clinical']):
-            return f"Regarding {requirement[:30]}..., I have successfully implemented HealthTech solutions across 12+ hospital facilities, including AI-driven Clinical Decision Support systems and Health Catalyst analytics platforms that improved patient outcomes by 35%."
-        
-        if any(word in req_lower for word in ['digital', 'transformation', 'technology']):
-            return f"My background in {requirement[:30]}... includes leading enterprise-wide digital transformations at both PaySky and El Araby Group, where I delivered SAP S/4HANA implementations and modernized operational systems serving millions of users."
-        
-        if any(word in req_lower for word in ['strategy', 'strategic']):
-            return f"In terms of {requirement[:30]}..., I have advised C-suite executives on multi-year strategic plans, market expansion strategies, and digital innovation roadmaps that delivered measurable ROI across FinTech and healthcare sectors."
-        
-        return f"Your requirement for {requirement[:40]}... resonates with my experience driving operational excellence and delivering complex initiatives on time and under budget across diverse industries."
+        # First bucket whose keywords occur in the requirement wins
+        for keywords_re, template in _REQUIREMENT_MATCHES:
+            if keywords_re.search(requirement):
+                break
+        else:
+            template = _DEFAULT_REQUIREMENT_MATCH
+        # Only the leadership paragraph names the requirement's first word; it matched a
+        # keyword, so the requirement has one
+        first_word = requirement.split(None, 1)[0] if '{first_word}' in template else ''
+        return template.format(req=requirement, first_word=first_word)
     
     def _get_key_achievement(self, profile: Dict) -> str:
         """Get a key achievement for closing paragraph"""
-        for exp in profile.get('experience', []):
-            achievements = exp.get('achievements', [])
-            for a in achievements:
-                if any(metric in a for metric in ['%', '$', 'M', 'K', 'fold']):
-                    return a[:100] + "..."
-        return "delivering large-scale transformation initiatives"
+        return next(
+            (a[:100] + "..."
+             for exp in profile.get('experience', [])
+             for a in exp.get('achievements', [])
+             if _METRIC_RE.search(a)),
+            "delivering large-scale transformation initiatives"
+        )
     
     def predict_interview_questions(self, job_title: str, company: str, 
                                    job_description: str) -> List[Dict]:
@@ -219,53 +470,13 @@ Sincerely,
         """
         questions = []
         
-        # Role-based questions
-        role_questions = {
-            'pmo': [
-                {
-                    'question': 'How do you establish a PMO from scratch?',
-                    'framework': 'Use STAR method: Situation (blank slate), Task (build PMO), Action (governance, tools, training), Result (300 projects managed)',
-                    'key_points': ['Governance framework', 'Tool selection', 'Change management', 'Metrics definition']
-                },
-                {
-                    'question': 'How do you handle conflicting priorities across multiple projects?',
-                    'framework': 'Discuss portfolio prioritization, stakeholder alignment, and resource optimization',
-                    'key_points': ['OKR alignment', 'Resource allocation', 'Stakeholder communication', 'Risk assessment']
-                }
-            ],
-            'healthtech': [
-                {
-                    'question': 'How do you ensure clinical adoption of new technology?',
-                    'framework': 'Emphasize change management, training, and demonstrating value to clinicians',
-                    'key_points': ['Physician champions', 'Workflow integration', 'Training programs', 'Success metrics']
-                },
-                {
-                    'question': 'Describe your experience with healthcare data analytics.',
-                    'framework': 'Highlight Health Catalyst, EDW implementation, and clinical outcomes improvement',
-                    'key_points': ['Health Catalyst EDW', 'Predictive analytics', 'Clinical decision support', 'ROI measurement']
-                }
-            ],
-            'leadership': [
-                {
-                    'question': 'Tell me about a time you led a major transformation.',
-                    'framework': 'Use the example from TopMed/SGH: scale, complexity, multi-country, measurable results',
-                    'key_points': ['Digital transformation', 'Cross-functional teams', 'Change management', 'Measurable outcomes']
-                },
-                {
-                    'question': 'How do you align technology initiatives with business strategy?',
-                    'framework': 'Discuss strategic planning, OKRs, stakeholder engagement, and ROI focus',
-                    'key_points': ['Strategic alignment', 'Business case development', 'Executive communication', 'Value delivery']
-                }
-            ]
-        }
-        
         # Add role-specific questions
         job_lower = job_title.lower()
         if 'pmo' in job_lower or 'project' in job_lower:
-            questions.extend(role_questions['pmo'])
-        if any(word in job_lower for word in ['health', 'hospital', 'medical']):
-            questions.extend(role_questions['healthtech'])
-        questions.extend(role_questions['leadership'])
+            questions.extend(_ROLE_QUESTIONS['pmo'])
+        if any(word in job_lower for word in _HEALTH_TITLE_WORDS):
+            questions.extend(_ROLE_QUESTIONS['healthtech'])
+        questions.extend(_ROLE_QUESTIONS['leadership'])
         
         # Company-specific questions
         questions.append({
@@ -275,18 +486,7 @@ Sincerely,
         })
         
         # Behavioral questions
-        questions.extend([
-            {
-                'question': 'Tell me about a failure and what you learned.',
-                'framework': 'Be honest, focus on learning and growth, show resilience',
-                'key_points': ['Specific situation', 'Your responsibility', 'Lesson learned', 'How you applied it']
-            },
-            {
-                'question': 'How do you handle stress and tight deadlines?',
-                'framework': 'Discuss prioritization, delegation, and maintaining quality under pressure',
-                'key_points': ['Prioritization methods', 'Team support', 'Communication', 'Self-care']
-            }
-        ])
+        questions.extend(_BEHAVIORAL_QUESTIONS)
         
         return questions[:8]  # Top 8 questions
     
@@ -405,6 +405,10 @@ COVER_LETTER_TEMPLATE = """
 </html>
 """
 
+# Templates compiled once at import; every PDF only pays for rendering
+_CV_TEMPLATE = Template(CV_TEMPLATE)
+_COVER_LETTER_TEMPLATE = Template(COVER_LETTER_TEMPLATE)
+
 class PDFExporter:
     """Export CVs and cover letters as professional PDFs"""
     
@@ -415,9 +419,8 @@ class PDFExporter:
     def generate_cv_pdf(self, cv_data: Dict, filename: str = None) -> str:
         """Generate PDF from CV data using Jinja2"""
         
-        # Build HTML from template using Jinja2
-        template = Template(CV_TEMPLATE)
-        html_content = template.render(**cv_data)
+        # Build HTML from the precompiled Jinja2 template
+        html_content = _CV_TEMPLATE.render(**cv_data)
         
         # Generate filename
         if not filename:
@@ -435,13 +438,11 @@ class PDFExporter:
     def generate_cover_letter_pdf(self, letter_data: Dict, filename: str = None) -> str:
         """Generate PDF from cover letter data using Jinja2"""
         
-        # Build HTML from template using Jinja2
-        template = Template(COVER_LETTER_TEMPLATE)
-        
         # Format date
         letter_data['date'] = letter_data.get('date', datetime.now().strftime('%B %d, %Y'))
         
-        html_content = template.render(**letter_data)
+        # Build HTML from the precompiled Jinja2 template
+        html_content = _COVER_LETTER_TEMPLATE.render(**letter_data)
         
         # Generate filename
         if not filename:
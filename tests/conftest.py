@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modules under src/ import each other by bare name, as mission_control.py sets up
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,39 @@
+import pytest
+
+from adham_analyzer import ADHAMAnalyzer
+
+JOB_POSTING = """Senior Cloud Engineer
+About the role
+The ideal candidate will have strong experience and proven skills. Required: 5+ years
+experience in cloud platforms, Kubernetes and Terraform. Preferred qualifications include
+excellent knowledge of Kubernetes operators and the ability to work across teams.
+Responsibilities: own Terraform modules, Kubernetes upgrades and cloud cost reviews.
+"""
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return ADHAMAnalyzer()
+
+
+def test_posting_boilerplate_is_not_a_keyword(analyzer):
+    terms = [kw.term for kw in analyzer._extract_job_features(JOB_POSTING).keywords]
+
+    assert set(terms[:3]) == {"kubernetes", "cloud", "terraform"}
+    for boilerplate in ("experience", "required", "years", "skills", "strong", "role"):
+        assert boilerplate not in terms
+
+
+def test_keywords_match_whole_words_only(analyzer):
+    job_posting = (
+        "Senior Engineer\n"
+        "We are hiring an engineer who is a team player. Required: engineer with cloud skills.\n"
+    )
+    cv_text = "Jane Doe\nEngineering lead and a true team player with cloud delivery."
+    analysis = analyzer.analyze(job_posting, cv_text, {"education": [], "certifications": []})
+
+    # "engineer" used to count as present because the CV says "engineering"
+    assert "engineer" in [gap.keyword for gap in analysis.high_priority_gaps]
+    assert "cloud" not in [gap.keyword for gap in analysis.high_priority_gaps]
+    # Multi-word soft skills still match inside the CV text
+    assert analysis.score_breakdown.soft_skills.details["matched"] == ["team player"]
@@ -0,0 +1,101 @@
+import json
+import os
+
+import pytest
+
+from ahmed_profile import AHMED_PROFILE
+from ai_cv_rewriter import AICVRewriter
+
+
+@pytest.fixture
+def rewriter(tmp_path):
+    rewriter = AICVRewriter()
+    rewriter.data_dir = str(tmp_path)
+    rewriter.variants_file = str(tmp_path / 'cv_variants.jsonl')
+    return rewriter
+
+
+def test_cover_letter_with_dash_separator_line(rewriter):
+    job_description = (
+        "Senior Director, Digital Health\n"
+        "-----------------------------\n"
+        "- Lead a team of fifty engineers across the region\n"
+        "\n"
+        "• Healthcare and clinical systems experience\n"
+    )
+
+    assert rewriter._extract_requirements(job_description) == [
+        "Lead a team of fifty engineers across the region",
+        "Healthcare and clinical systems experience",
+    ]
+    letter = rewriter.generate_cover_letter(AHMED_PROFILE, 'Director', 'Acme', job_description)
+    assert "Your requirement for Lead leadership" in letter
+    assert "Regarding Healthcare and clinical system..." in letter
+
+
+def _editable(profile):
+    return {**profile, 'experience': [dict(exp) for exp in profile['experience']]}
+
+
+def test_cv_variant_keeps_full_experience_entries(rewriter):
+    variant = rewriter.generate_cv_variant(AHMED_PROFILE, 'CTO', 'Acme', 'general')
+
+    first = variant['content']['experience'][0]
+    assert first['company'] == AHMED_PROFILE['experience'][0]['company']
+    assert first['achievements'] == AHMED_PROFILE['experience'][0]['achievements']
+    assert first['highlighted_achievements'] == list(first['achievements'][:3])
+    assert 'profile_key' not in variant
+    assert rewriter.get_variant(variant['id'], AHMED_PROFILE) == variant
+
+
+def test_cv_variant_rehydrates_from_its_own_profile(rewriter):
+    profile = _editable(AHMED_PROFILE)
+    profile['experience'][0]['achievements'] = ['Grew the project portfolio', 'Hired a team']
+    variant = rewriter.generate_cv_variant(profile, 'CTO', 'Acme', 'pmo')
+
+    assert variant['content']['experience'][0]['highlighted_achievements'] == [
+        'Grew the project portfolio', 'Hired a team'
+    ]
+    assert rewriter.get_variant(variant['id'], profile) == variant
+    with pytest.raises(ValueError):
+        rewriter.get_variant(variant['id'], AHMED_PROFILE)
+
+
+def test_cv_variant_refuses_an_edited_profile(rewriter):
+    profile = _editable(AHMED_PROFILE)
+    variant = rewriter.generate_cv_variant(profile, 'CTO', 'Acme', 'healthtech')
+    profile['experience'][0]['achievements'] = ['Something else entirely']
+
+    with pytest.raises(ValueError):
+        rewriter.get_variant(variant['id'], profile)
+    assert rewriter.get_variant('variant_404', profile) is None
+
+
+def test_cv_variant_headline_with_certifications_list(rewriter):
+    profile = {**AHMED_PROFILE, 'certifications': ['PMP', 'CSM']}
+    variant = rewriter.generate_cv_variant(profile, 'CTO', 'Acme', 'fintech')
+
+    assert variant['content']['headline'] == "FinTech Strategy & Operations Executive | ['PMP', 'CSM']"
+
+
+def test_variants_migrate_from_legacy_json_and_reload_on_change(rewriter, tmp_path):
+    legacy = [{'id': 'variant_1', 'target_company': 'Old Co', 'content': {'experience': []}}]
+    (tmp_path / 'cv_variants.json').write_text(json.dumps(legacy))
+
+    assert rewriter.variants == legacy
+    assert [json.loads(line) for line in open(rewriter.variants_file)] == legacy
+
+    variant = rewriter.generate_cv_variant(AHMED_PROFILE, 'CTO', 'Acme')
+    assert variant['id'] == 'variant_2'
+    # A fresh rewriter reads both back from the log, without migrating again
+    reader = AICVRewriter()
+    reader.data_dir, reader.variants_file = rewriter.data_dir, rewriter.variants_file
+    assert [v['id'] for v in reader.variants] == ['variant_1', 'variant_2']
+
+    # Another process appends to the log; the next read picks it up
+    with open(rewriter.variants_file, 'a') as f:
+        f.write(json.dumps({'id': 'variant_3', 'content': {}}) + '\n')
+    stat = os.stat(rewriter.variants_file)
+    os.utime(rewriter.variants_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [v['id'] for v in rewriter.variants] == ['variant_1', 'variant_2', 'variant_3']